@@ -18,22 +18,21 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 from src.config import ConfigManager
 from src.arxiv_scraper import ArxivScraper
 from src.utils import setup_logging, send_notification, ensure_directories
-from src.config_wizard import run_config_wizard, save_config
-from config_migration import ConfigMigration
 
 
-def run_scraper(config_manager: ConfigManager) -> None:
+def run_scraper(config_manager: ConfigManager, refresh: bool = False) -> None:
     """
     执行一次论文抓取任务
 
     Args:
         config_manager: 配置管理器
+        refresh: 是否忽略当天的搜索缓存
     """
     logger = logging.getLogger(__name__)
 
     try:
         # 创建抓取器实例
-        scraper = ArxivScraper(config_manager.config)
+        scraper = ArxivScraper(config_manager.config, refresh_search_cache=refresh)
 
         # 执行抓取
         result = scraper.run()
@@ -83,12 +82,13 @@ def check_config_migration() -> None:
         print("=" * 60 + "\n")
 
 
-def run_once(config_path: str) -> None:
+def run_once(config_path: str, refresh: bool = False) -> None:
     """
     执行一次抓取任务
 
     Args:
         config_path: 配置文件路径
+        refresh: 是否忽略当天的搜索缓存
     """
     # 加载配置
     config_manager = ConfigManager(config_path)
@@ -104,15 +104,16 @@ def run_once(config_path: str) -> None:
     logger.info("以单次模式运行")
 
     # 执行抓取
-    run_scraper(config_manager)
+    run_scraper(config_manager, refresh)
 
 
-def run_scheduled(config_path: str) -> None:
+def run_scheduled(config_path: str, refresh: bool = False) -> None:
     """
     以调度模式运行
 
     Args:
         config_path: 配置文件路径
+        refresh: 是否在启动时的首次抓取中忽略当天的搜索缓存（之后的定时任务照常使用缓存）
     """
     # 加载配置
     config_manager = ConfigManager(config_path)
@@ -131,7 +132,7 @@ def run_scheduled(config_path: str) -> None:
 
     if not schedule_config.get("enabled", False):
         logger.warning("调度功能未启用，使用单次模式")
-        run_scraper(config_manager)
+        run_scraper(config_manager, refresh)
         return
 
     # 设置定时任务
@@ -144,7 +145,9 @@ def run_scheduled(config_path: str) -> None:
     # 立即执行一次（可选）
     if schedule_config.get("run_on_start", False):
         logger.info("执行启动时抓取")
-        run_scraper(config_manager)
+        run_scraper(config_manager, refresh)
+    elif refresh:
+        logger.warning("未启用 run_on_start，--refresh 在调度模式下不生效")
 
     # 循环等待
     try:
@@ -157,6 +160,10 @@ def run_scheduled(config_path: str) -> None:
 
 def create_sample_config() -> None:
     """创建示例配置文件"""
+    # 仅在初始化配置时用到，延迟导入以免常规运行加载 ruamel.yaml
+    from src.config_wizard import run_config_wizard, save_config
+    from config_migration import ConfigMigration
+
     if os.path.exists("config.yaml"):
         print("配置文件 config.yaml 已存在")
         print("\n请选择操作:")
@@ -261,6 +268,7 @@ def main():
   %(prog)s --schedule         # 以调度模式运行
   %(prog)s --config my.yaml   # 使用指定配置文件
   %(prog)s --init             # 创建示例配置文件
+  %(prog)s --refresh          # 忽略搜索缓存重新抓取
         """,
     )
 
@@ -274,6 +282,10 @@ def main():
 
     parser.add_argument("--init", action="store_true", help="创建示例配置文件")
 
+    parser.add_argument(
+        "--refresh", action="store_true", help="忽略当天的搜索缓存，重新查询 ArXiv"
+    )
+
     parser.add_argument(
         "-v", "--version", action="version", version="ArXiv Scraper 1.0.0"
     )
@@ -298,9 +310,9 @@ def main():
     # 运行
     try:
         if args.schedule:
-            run_scheduled(args.config)
+            run_scheduled(args.config, args.refresh)
         else:
-            run_once(args.config)
+            run_once(args.config, args.refresh)
     except Exception as e:
         print(f"错误: {str(e)}")
         sys.exit(1)
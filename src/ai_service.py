@@ -4,11 +4,12 @@ AI 服务模块
 支持多种 AI API：OpenAI、Anthropic、Ollama 等
 """
 
+import json
 import logging
 import requests
 from typing import Dict, Any, Optional, List
 from abc import ABC, abstractmethod
-from .prompt_loader import get_prompt_loader
+from .prompt_loader import DEFAULT_PROMPTS_FILE, get_prompt_loader
 from .utils import create_retry_session
 
 
@@ -18,6 +19,15 @@ class AIServiceError(Exception):
     pass
 
 
+def _extract_json_text(response_text: str) -> str:
+    """提取响应中的 JSON 部分（处理可能的 markdown 代码块）"""
+    if "```json" in response_text:
+        return response_text.split("```json")[1].split("```")[0].strip()
+    if "```" in response_text:
+        return response_text.split("```")[1].split("```")[0].strip()
+    return response_text
+
+
 class BaseAIService(ABC):
     """AI 服务基类"""
 
@@ -30,6 +40,24 @@ class BaseAIService(ABC):
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
+        self.combined_processing = bool(config.get("combined_processing", False))
+        self.prompt_loader = get_prompt_loader(
+            config.get("prompts_file", DEFAULT_PROMPTS_FILE)
+        )
+
+    @abstractmethod
+    def _complete(self, system_prompt: str, user_prompt: str) -> str:
+        """
+        发送一次对话请求
+
+        Args:
+            system_prompt: 系统提示词
+            user_prompt: 用户提示词
+
+        Returns:
+            API 响应文本
+        """
+        pass
 
     @abstractmethod
     def summarize_paper(self, paper: Dict[str, Any]) -> Dict[str, str]:
@@ -93,6 +121,103 @@ class BaseAIService(ABC):
         """
         pass
 
+    def process_paper(
+        self,
+        paper: Dict[str, Any],
+        do_summary: bool = True,
+        do_translation: bool = True,
+        do_insights: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        对单篇论文执行总结、翻译和洞察提取
+
+        Args:
+            paper: 论文数据
+            do_summary: 是否生成总结
+            do_translation: 是否翻译摘要
+            do_insights: 是否提取洞察
+
+        Returns:
+            包含 ai_summary / translation / insights 中所需字段的字典
+        """
+        # 需要多项结果时，可合并为一次 API 调用（需要 prompts 中的 combined 模板）
+        if self.combined_processing and do_summary + do_translation + do_insights > 1:
+            result = self._process_paper_combined(
+                paper, do_summary, do_translation, do_insights
+            )
+            if result is not None:
+                return result
+
+        result = {}
+        if do_summary:
+            result["ai_summary"] = self.summarize_paper(paper)
+        if do_translation:
+            result["translation"] = self.translate_text(paper.get("summary", ""))
+        if do_insights:
+            result["insights"] = self.extract_insights(paper)
+        return result
+
+    def _process_paper_combined(
+        self,
+        paper: Dict[str, Any],
+        do_summary: bool,
+        do_translation: bool,
+        do_insights: bool,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        用一次 API 调用同时完成总结、翻译和洞察提取
+
+        Returns:
+            处理结果；模板缺失或响应无法解析时返回 None，由调用方回退为逐项调用
+        """
+        if "combined" not in self.prompt_loader.prompts:
+            return None
+
+        system_prompt, user_prompt = self.prompt_loader.get_prompt(
+            "combined",
+            title=paper.get("title", "N/A"),
+            authors=", ".join(paper.get("authors", [])[:3]),
+            summary=paper.get("summary", ""),
+            lang_name="中文",
+        )
+
+        try:
+            response_text = self._complete(system_prompt, user_prompt)
+            data = json.loads(_extract_json_text(response_text))
+            if not isinstance(data, dict):
+                raise ValueError("响应不是 JSON 对象")
+        except Exception as e:
+            self.logger.warning(f"合并处理失败，改为逐项调用: {str(e)}")
+            return None
+
+        result = {}
+        if do_summary:
+            summary_text = data.get("summary")
+            if isinstance(summary_text, str) and summary_text.strip():
+                result["ai_summary"] = {
+                    "summary": summary_text.strip(),
+                    "status": "success",
+                }
+            else:
+                result["ai_summary"] = self.summarize_paper(paper)
+        if do_translation:
+            translation = data.get("translation")
+            if not isinstance(translation, str):
+                translation = ""
+            result["translation"] = translation.strip() or self.translate_text(
+                paper.get("summary", "")
+            )
+        if do_insights:
+            insights = data.get("insights")
+            if isinstance(insights, list) and insights:
+                result["insights"] = {
+                    "insights": [str(item) for item in insights][:5],
+                    "status": "success",
+                }
+            else:
+                result["insights"] = self.extract_insights(paper)
+        return result
+
 
 class OpenAIService(BaseAIService):
     """OpenAI API 服务"""
@@ -109,7 +234,6 @@ class OpenAIService(BaseAIService):
             total_retries=int(config.get("max_retries", 3)),
             backoff_factor=float(config.get("backoff_factor", 0.5)),
         )
-        self.prompt_loader = get_prompt_loader()
 
         if not self.api_key:
             raise AIServiceError("OpenAI API key 未配置")
@@ -153,6 +277,14 @@ class OpenAIService(BaseAIService):
             self.logger.error(f"OpenAI API 调用失败: {str(e)}")
             raise AIServiceError(f"API 调用失败: {str(e)}")
 
+    def _complete(self, system_prompt: str, user_prompt: str) -> str:
+        """发送一次对话请求"""
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+        return self._call_api(messages)
+
     def summarize_paper(self, paper: Dict[str, Any]) -> Dict[str, str]:
         """总结论文"""
         title = paper.get("title", "N/A")
@@ -222,14 +354,7 @@ class OpenAIService(BaseAIService):
             # 尝试解析 JSON
             try:
                 # 提取 JSON 部分（处理可能的 markdown 代码块）
-                if "```json" in response_text:
-                    response_text = (
-                        response_text.split("```json")[1].split("```")[0].strip()
-                    )
-                elif "```" in response_text:
-                    response_text = (
-                        response_text.split("```")[1].split("```")[0].strip()
-                    )
+                response_text = _extract_json_text(response_text)
 
                 insights_data = json_lib.loads(response_text)
                 return {
@@ -283,14 +408,7 @@ class OpenAIService(BaseAIService):
             # 尝试解析 JSON
             try:
                 # 提取 JSON 部分（处理可能的 markdown 代码块）
-                if "```json" in response_text:
-                    response_text = (
-                        response_text.split("```json")[1].split("```")[0].strip()
-                    )
-                elif "```" in response_text:
-                    response_text = (
-                        response_text.split("```")[1].split("```")[0].strip()
-                    )
+                response_text = _extract_json_text(response_text)
 
                 filter_result = json_lib.loads(response_text)
                 return {
@@ -333,7 +451,6 @@ class AnthropicService(BaseAIService):
             total_retries=int(config.get("max_retries", 3)),
             backoff_factor=float(config.get("backoff_factor", 0.5)),
         )
-        self.prompt_loader = get_prompt_loader()
 
         if not self.api_key:
             raise AIServiceError("Anthropic API key 未配置")
@@ -382,6 +499,10 @@ class AnthropicService(BaseAIService):
             self.logger.error(f"Anthropic API 调用失败: {str(e)}")
             raise AIServiceError(f"API 调用失败: {str(e)}")
 
+    def _complete(self, system_prompt: str, user_prompt: str) -> str:
+        """发送一次对话请求"""
+        return self._call_api(user_prompt, system_prompt)
+
     def summarize_paper(self, paper: Dict[str, Any]) -> Dict[str, str]:
         """总结论文"""
         title = paper.get("title", "N/A")
@@ -482,14 +603,7 @@ class AnthropicService(BaseAIService):
             # 尝试解析 JSON
             try:
                 # 提取 JSON 部分（处理可能的 markdown 代码块）
-                if "```json" in response_text:
-                    response_text = (
-                        response_text.split("```json")[1].split("```")[0].strip()
-                    )
-                elif "```" in response_text:
-                    response_text = (
-                        response_text.split("```")[1].split("```")[0].strip()
-                    )
+                response_text = _extract_json_text(response_text)
 
                 filter_result = json_lib.loads(response_text)
                 return {
@@ -529,7 +643,6 @@ class OllamaService(BaseAIService):
             total_retries=int(config.get("max_retries", 3)),
             backoff_factor=float(config.get("backoff_factor", 0.5)),
         )
-        self.prompt_loader = get_prompt_loader()
 
     def _call_api(self, prompt: str, system: str = None) -> str:
         """
@@ -561,6 +674,10 @@ class OllamaService(BaseAIService):
             self.logger.error(f"Ollama API 调用失败: {str(e)}")
             raise AIServiceError(f"API 调用失败: {str(e)}")
 
+    def _complete(self, system_prompt: str, user_prompt: str) -> str:
+        """发送一次对话请求"""
+        return self._call_api(user_prompt, system_prompt)
+
     def summarize_paper(self, paper: Dict[str, Any]) -> Dict[str, str]:
         """总结论文"""
         title = paper.get("title", "N/A")
@@ -661,14 +778,7 @@ class OllamaService(BaseAIService):
             # 尝试解析 JSON
             try:
                 # 提取 JSON 部分（处理可能的 markdown 代码块）
-                if "```json" in response_text:
-                    response_text = (
-                        response_text.split("```json")[1].split("```")[0].strip()
-                    )
-                elif "```" in response_text:
-                    response_text = (
-                        response_text.split("```")[1].split("```")[0].strip()
-                    )
+                response_text = _extract_json_text(response_text)
 
                 filter_result = json_lib.loads(response_text)
                 return {
@@ -710,7 +820,13 @@ def _merge_provider_config(
         合并后的配置字典
     """
     provider_config = dict(ai_config.get(provider_key, {}))
-    for key in ["max_retries", "backoff_factor", "request_timeout"]:
+    for key in [
+        "max_retries",
+        "backoff_factor",
+        "request_timeout",
+        "combined_processing",
+        "prompts_file",
+    ]:
         if key in ai_config and key not in provider_config:
             provider_config[key] = ai_config[key]
     return provider_config
@@ -4,15 +4,16 @@ ArXiv 论文抓取模块
 """
 
 import arxiv
+import csv
 import hashlib
 import json
 import os
 import logging
+import re
 import time
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import pandas as pd
 
 from .ai_service import create_ai_service
 from .markdown_generator import MarkdownGenerator
@@ -21,20 +22,86 @@ from .utils import (
     send_report_via_webhook,
     format_paper_summary,
     create_retry_session,
+    dumps_json_bytes,
 )
 
+# PDF 流式下载的分块大小（1 MB）
+# 大于文件缓冲区时 BufferedWriter 会直接写入，每块只需一次 write 系统调用
+PDF_CHUNK_SIZE = 1024 * 1024
+
+# ArXiv API 单页最大结果数
+ARXIV_MAX_PAGE_SIZE = 1000
+
+# 搜索缓存文件名：search_<日期>_<查询 SHA1>.json
+SEARCH_CACHE_FILE_PATTERN = re.compile(r"search_(\d{8})_[0-9a-f]{40}\.json")
+
+# 参与缓存签名的 prompt 段落（合并处理的 combined 段仅在启用时单独计入 AI 缓存键）
+PROMPT_SIGNATURE_SECTIONS = ("summarize", "translate", "insights", "filter")
+
+# 配置中的排序字段 -> ArXiv API 排序标准
+ARXIV_SORT_CRITERIA = {
+    "submittedDate": arxiv.SortCriterion.SubmittedDate,
+    "lastUpdatedDate": arxiv.SortCriterion.LastUpdatedDate,
+    "relevance": arxiv.SortCriterion.Relevance,
+}
+
+# 配置中的排序顺序 -> ArXiv API 排序顺序
+ARXIV_SORT_ORDERS = {
+    "descending": arxiv.SortOrder.Descending,
+    "ascending": arxiv.SortOrder.Ascending,
+}
+
+# CSV 中以 "; " 拼接输出的列表字段
+CSV_LIST_FIELDS = frozenset(("authors", "categories", "links"))
+
+
+class _ReversedKey:
+    """反转比较顺序的排序键包装，用于在升序排序中实现字符串字段的降序"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __eq__(self, other: "_ReversedKey") -> bool:
+        return self.value == other.value
+
+    def __lt__(self, other: "_ReversedKey") -> bool:
+        return other.value < self.value
+
+
+def _make_descending_key(key_func):
+    """将升序排序键函数转换为降序"""
+    if key_func is SORT_KEY_FUNCS["relevance_score"]:
+        # 数值字段直接取负，避免包装对象的比较开销
+        return lambda paper: -key_func(paper)
+    return lambda paper: _ReversedKey(key_func(paper))
+
+
+# 多级排序字段 -> 排序键函数
+SORT_KEY_FUNCS = {
+    "submittedDate": lambda paper: paper.get("published", ""),
+    "published": lambda paper: paper.get("published", ""),
+    "lastUpdatedDate": lambda paper: paper.get("updated", ""),
+    "updated": lambda paper: paper.get("updated", ""),
+    "relevance_score": lambda paper: paper.get("relevance_score", 0.0),
+    "title": lambda paper: paper.get("title", ""),
+}
+
 
 class ArxivScraper:
     """ArXiv 论文抓取器"""
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], refresh_search_cache: bool = False):
         """
         初始化抓取器
 
         Args:
             config: 配置字典
+            refresh_search_cache: 是否忽略当天的搜索缓存，强制重新查询 ArXiv
         """
         self.config = config
+        self.refresh_search_cache = refresh_search_cache
         self.logger = logging.getLogger(__name__)
         self.arxiv_config = config.get("arxiv", {})
         self.storage_config = config.get("storage", {})
@@ -46,7 +113,20 @@ class ArxivScraper:
         if self.storage_config.get("download_pdf", False):
             os.makedirs(self.pdf_dir, exist_ok=True)
 
-        self.http_session = create_retry_session()
+        try:
+            self.pdf_max_workers = max(
+                1, int(self.storage_config.get("pdf_max_workers", 4))
+            )
+        except (TypeError, ValueError):
+            self.pdf_max_workers = 4
+
+        # 所有 PDF 下载线程共享同一个 Session，连接池需容纳全部线程
+        self.http_session = create_retry_session(
+            pool_maxsize=max(10, self.pdf_max_workers)
+        )
+        # 按 ArXiv 的爬取建议标明客户端身份
+        self.http_session.headers["User-Agent"] = "ArXiv-Paper-Agent/1.0"
+        self._arxiv_client: Optional[arxiv.Client] = None
 
         self.cache_enabled = bool(self.storage_config.get("cache_enabled", True))
         self.cache_file = self.storage_config.get(
@@ -58,8 +138,10 @@ class ArxivScraper:
             self.cache_max_items = 5000
         self.cache: Dict[str, Dict[str, Any]] = {}
         self.cache_dirty = False
-        self.ai_cache_key = self._build_ai_cache_key()
-        self.filter_cache_key = self._build_filter_cache_key()
+        # prompts 签名需要读取并解析 YAML，两个缓存键共用一次计算结果
+        prompts_signature = self._get_prompts_signature()
+        self.ai_cache_key = self._build_ai_cache_key(prompts_signature)
+        self.filter_cache_key = self._build_filter_cache_key(prompts_signature)
         if self.cache_enabled:
             self._load_cache()
 
@@ -109,38 +191,12 @@ class ArxivScraper:
         self.logger.info(f"开始搜索论文，最大结果数: {max_results}")
 
         try:
-            search = arxiv.Search(
-                query=query,
-                max_results=max_results,
-                sort_by=sort_by,
-                sort_order=sort_order,
-            )
+            search_cache_path = self._get_search_cache_path(query, max_results)
+            papers = self._load_search_cache(search_cache_path)
 
-            client = arxiv.Client(page_size=20, delay_seconds=3.0, num_retries=3)
-
-            papers = []
-            retry_count = 0
-            max_retries = 3
-
-            while retry_count < max_retries:
-                try:
-                    for result in client.results(search):
-                        paper_data = self._extract_paper_data(result)
-                        papers.append(paper_data)
-                    break
-                except arxiv.UnexpectedEmptyPageError:
-                    self.logger.warning("ArXiv 返回空页面，可能已获取全部结果")
-                    break
-                except arxiv.HTTPError as e:
-                    retry_count += 1
-                    if retry_count < max_retries:
-                        wait_time = 5 * retry_count
-                        self.logger.warning(
-                            f"ArXiv API 错误: {e}，{wait_time}秒后重试 ({retry_count}/{max_retries})"
-                        )
-                        time.sleep(wait_time)
-                    else:
-                        raise
+            if papers is None:
+                papers = self._fetch_papers(query, max_results, sort_by, sort_order)
+                self._save_search_cache(search_cache_path, papers)
 
             self.logger.info(f"成功获取 {len(papers)} 篇论文")
 
@@ -150,6 +206,9 @@ class ArxivScraper:
             # 计算相关度评分
             papers = self._calculate_relevance_scores(papers)
 
+            # 先按相关度阈值过滤，缩小后续排序和 AI 处理的规模
+            papers = self._filter_by_relevance(papers)
+
             # 应用多级排序（如果配置了）
             papers = self._apply_multi_level_sort(papers)
 
@@ -159,6 +218,174 @@ class ArxivScraper:
             self.logger.error(f"搜索论文时出错: {str(e)}")
             raise
 
+    def _fetch_papers(
+        self,
+        query: str,
+        max_results: int,
+        sort_by: arxiv.SortCriterion,
+        sort_order: arxiv.SortOrder,
+    ) -> List[Dict[str, Any]]:
+        """
+        从 ArXiv API 获取论文
+
+        Args:
+            query: 查询字符串
+            max_results: 最大结果数
+            sort_by: 排序标准
+            sort_order: 排序顺序
+
+        Returns:
+            论文列表
+        """
+        search = arxiv.Search(
+            query=query,
+            max_results=max_results,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
+
+        client = self._get_arxiv_client(max_results)
+
+        papers = []
+        seen_ids = set()
+        retry_count = 0
+        max_retries = 3
+
+        while retry_count < max_retries:
+            try:
+                # 边获取边去重：重试时会从头遍历结果，已获取的论文直接跳过
+                for result in client.results(search):
+                    arxiv_id = result.entry_id.split("/")[-1]
+                    if arxiv_id in seen_ids:
+                        continue
+                    seen_ids.add(arxiv_id)
+                    papers.append(self._extract_paper_data(result))
+                break
+            except arxiv.UnexpectedEmptyPageError:
+                self.logger.warning("ArXiv 返回空页面，可能已获取全部结果")
+                break
+            except arxiv.HTTPError as e:
+                retry_count += 1
+                if retry_count < max_retries:
+                    wait_time = 5 * retry_count
+                    self.logger.warning(
+                        f"ArXiv API 错误: {e}，{wait_time}秒后重试 ({retry_count}/{max_retries})"
+                    )
+                    time.sleep(wait_time)
+                else:
+                    raise
+
+        return papers
+
+    def _get_arxiv_client(self, max_results: int) -> arxiv.Client:
+        """
+        获取 ArXiv API 客户端（按需创建并复用）
+
+        单页大小覆盖 max_results（上限为 arxiv.page_size，默认 ARXIV_MAX_PAGE_SIZE），
+        大多数查询一次请求即可完成，无需等待翻页间隔
+
+        Args:
+            max_results: 最大结果数
+
+        Returns:
+            ArXiv 客户端
+        """
+        try:
+            max_page_size = int(self.arxiv_config.get("page_size", ARXIV_MAX_PAGE_SIZE))
+        except (TypeError, ValueError):
+            max_page_size = ARXIV_MAX_PAGE_SIZE
+        max_page_size = min(max_page_size, ARXIV_MAX_PAGE_SIZE)
+
+        page_size = max(1, min(int(max_results), max_page_size))
+        if self._arxiv_client is None or self._arxiv_client.page_size != page_size:
+            self._arxiv_client = arxiv.Client(
+                page_size=page_size, delay_seconds=3.0, num_retries=3
+            )
+        return self._arxiv_client
+
+    def _get_search_cache_path(self, query: str, max_results: int) -> Optional[str]:
+        """
+        获取当天搜索结果缓存文件路径
+
+        Args:
+            query: 查询字符串
+            max_results: 最大结果数
+
+        Returns:
+            缓存文件路径，未启用搜索缓存时返回 None
+        """
+        if not self.storage_config.get("search_cache_enabled", False):
+            return None
+
+        cache_dir = self.storage_config.get("search_cache_dir", "./data/.cache")
+        payload = "|".join(
+            [
+                query,
+                str(max_results),
+                str(self.arxiv_config.get("sort_by", "submittedDate")),
+                str(self.arxiv_config.get("sort_order", "descending")),
+            ]
+        )
+        cache_key = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+        date_str = datetime.now().strftime("%Y%m%d")
+        return os.path.join(cache_dir, f"search_{date_str}_{cache_key}.json")
+
+    def _load_search_cache(
+        self, cache_path: Optional[str]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """读取当天的搜索结果缓存，未命中时返回 None"""
+        if not cache_path or not os.path.exists(cache_path):
+            return None
+
+        if self.refresh_search_cache:
+            self.logger.info("已指定刷新，忽略当天的搜索缓存")
+            return None
+
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                papers = json.load(f)
+
+            if not isinstance(papers, list):
+                return None
+
+            self.logger.info(f"命中搜索缓存: {cache_path}（{len(papers)} 篇论文）")
+            return papers
+
+        except Exception as e:
+            self.logger.warning(f"读取搜索缓存失败: {str(e)}")
+            return None
+
+    def _save_search_cache(
+        self, cache_path: Optional[str], papers: List[Dict[str, Any]]
+    ) -> None:
+        """保存搜索结果缓存，并清理过期的缓存文件"""
+        if not cache_path:
+            return
+
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+
+                # 清理非当天的搜索缓存（只删除完整匹配缓存文件名的文件；
+                # 未配置缓存目录时不清理，避免误删当前工作目录中的文件）
+                current = SEARCH_CACHE_FILE_PATTERN.fullmatch(
+                    os.path.basename(cache_path)
+                )
+                today = current.group(1) if current else None
+                for name in os.listdir(cache_dir):
+                    match = SEARCH_CACHE_FILE_PATTERN.fullmatch(name)
+                    if match and match.group(1) != today:
+                        os.remove(os.path.join(cache_dir, name))
+
+            temp_path = f"{cache_path}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(dumps_json_bytes(papers))
+            os.replace(temp_path, cache_path)
+
+        except Exception as e:
+            self.logger.warning(f"保存搜索缓存失败: {str(e)}")
+
     def _calculate_relevance_scores(
         self, papers: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -184,6 +411,10 @@ class ArxivScraper:
 
         self.logger.info(f"开始计算论文相关度评分（基于 {len(keywords)} 个关键词）...")
 
+        # 关键词只需小写一次；满分只与关键词数量有关，可提前算出
+        keywords_lower = [keyword.lower() for keyword in keywords]
+        max_score = (5.0 + 3.0 + 2.0) * len(keywords_lower)
+
         for paper in papers:
             try:
                 # 提取论文文本
@@ -193,15 +424,11 @@ class ArxivScraper:
 
                 # 计算匹配分数
                 total_score = 0.0
-                max_score = 0.0
-
-                for keyword in keywords:
-                    keyword_lower = keyword.lower()
 
+                for keyword_lower in keywords_lower:
                     # 标题匹配（权重: 5.0）
                     if keyword_lower in title:
                         total_score += 5.0
-                    max_score += 5.0
 
                     # 摘要匹配（权重: 3.0）
                     # 计算关键词在摘要中出现的次数
@@ -209,12 +436,10 @@ class ArxivScraper:
                     if summary_count > 0:
                         # 出现次数越多分数越高，但有上限
                         total_score += min(summary_count * 0.5, 3.0)
-                    max_score += 3.0
 
                     # 分类匹配（权重: 2.0）
                     if keyword_lower in categories:
                         total_score += 2.0
-                    max_score += 2.0
 
                 # 归一化到 0.0-1.0
                 if max_score > 0:
@@ -234,14 +459,43 @@ class ArxivScraper:
         scores = [p["relevance_score"] for p in papers]
         if scores:
             avg_score = sum(scores) / len(scores)
-            max_score = max(scores)
-            min_score = min(scores)
             self.logger.info(
-                f"相关度评分完成 - 平均: {avg_score:.3f}, 最高: {max_score:.3f}, 最低: {min_score:.3f}"
+                f"相关度评分完成 - 平均: {avg_score:.3f}, 最高: {max(scores):.3f}, 最低: {min(scores):.3f}"
             )
 
         return papers
 
+    def _filter_by_relevance(
+        self, papers: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        过滤相关度评分低于阈值的论文
+
+        Args:
+            papers: 已计算相关度评分的论文列表
+
+        Returns:
+            过滤后的论文列表
+        """
+        try:
+            min_score = float(self.arxiv_config.get("min_relevance_score", 0.0))
+        except (TypeError, ValueError):
+            min_score = 0.0
+
+        if min_score <= 0:
+            return papers
+
+        filtered_papers = [
+            paper for paper in papers if paper.get("relevance_score", 0.0) >= min_score
+        ]
+
+        if len(filtered_papers) != len(papers):
+            self.logger.info(
+                f"相关度过滤（阈值 {min_score}）：{len(papers)} → {len(filtered_papers)} 篇论文"
+            )
+
+        return filtered_papers
+
     def _deduplicate_papers(self, papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         按 arxiv_id 去重
@@ -374,8 +628,15 @@ class ArxivScraper:
             return None
         return self.cache.get(cache_key)
 
-    def _get_prompts_signature(self) -> str:
-        """获取 prompts 配置签名，用于缓存失效判断"""
+    def _get_prompts_signature(
+        self, sections: Tuple[str, ...] = PROMPT_SIGNATURE_SECTIONS
+    ) -> str:
+        """
+        获取 prompts 配置签名，用于缓存失效判断
+
+        Args:
+            sections: 参与签名的 prompt 段落名称
+        """
         prompts_path = self.config.get("ai", {}).get(
             "prompts_file", "./prompts/prompts.yaml"
         )
@@ -387,10 +648,8 @@ class ArxivScraper:
 
             # 只计算关键 prompt 的哈希，忽略格式调整和注释
             relevant_prompts = {
-                "summarize": data.get("summarize") if isinstance(data, dict) else None,
-                "translate": data.get("translate") if isinstance(data, dict) else None,
-                "insights": data.get("insights") if isinstance(data, dict) else None,
-                "filter": data.get("filter") if isinstance(data, dict) else None,
+                name: data.get(name) if isinstance(data, dict) else None
+                for name in sections
             }
             serialized = json.dumps(relevant_prompts, sort_keys=True, ensure_ascii=True)
             return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
@@ -405,7 +664,16 @@ class ArxivScraper:
         serialized = json.dumps(payload, sort_keys=True, ensure_ascii=True)
         return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
 
-    def _build_ai_cache_key(self) -> str:
+    def _add_prompt_version(
+        self, payload: Dict[str, Any], ai_config: Dict[str, Any]
+    ) -> None:
+        """加入手动设置的 prompt 版本号（修改后可强制让缓存失效）"""
+        prompt_version = ai_config.get("prompt_version")
+        # 未设置时不写入，保持已有缓存键不变
+        if prompt_version:
+            payload["prompt_version"] = str(prompt_version)
+
+    def _build_ai_cache_key(self, prompts_signature: str) -> str:
         """构建 AI 处理缓存键"""
         ai_config = self.config.get("ai", {})
         provider = ai_config.get("provider", "openai").lower()
@@ -418,11 +686,18 @@ class ArxivScraper:
             "base_url": provider_config.get("base_url"),
             "max_tokens": provider_config.get("max_tokens"),
             "temperature": provider_config.get("temperature"),
-            "prompts_signature": self._get_prompts_signature(),
+            "prompts_signature": prompts_signature,
         }
+        # 合并处理使用独立的 prompt 且输出可能不同；仅在启用时写入，保持未启用时的缓存键不变
+        if ai_config.get("combined_processing", False):
+            payload["combined_processing"] = True
+            payload["combined_prompt_signature"] = self._get_prompts_signature(
+                ("combined",)
+            )
+        self._add_prompt_version(payload, ai_config)
         return self._hash_payload(payload)
 
-    def _build_filter_cache_key(self) -> str:
+    def _build_filter_cache_key(self, prompts_signature: str) -> str:
         """构建筛选缓存键"""
         ai_config = self.config.get("ai", {})
         provider = ai_config.get("provider", "openai").lower()
@@ -434,8 +709,9 @@ class ArxivScraper:
             "model": provider_config.get("model"),
             "base_url": provider_config.get("base_url"),
             "filter_keywords": ai_config.get("filter_keywords", "").strip(),
-            "prompts_signature": self._get_prompts_signature(),
+            "prompts_signature": prompts_signature,
         }
+        self._add_prompt_version(payload, ai_config)
         return self._hash_payload(payload)
 
     def _load_cache(self) -> None:
@@ -487,8 +763,8 @@ class ArxivScraper:
             payload = {"version": 1, "items": self.cache}
 
             temp_path = f"{self.cache_file}.tmp"
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False, indent=2)
+            with open(temp_path, "wb") as f:
+                f.write(dumps_json_bytes(payload, indent=True))
             os.replace(temp_path, self.cache_file)
             self.cache_dirty = False
             self.logger.info(f"缓存已保存: {self.cache_file}")
@@ -552,57 +828,43 @@ class ArxivScraper:
 
         self.logger.info(f"应用多级排序: {len(multi_sort)} 个排序条件")
 
-        # 定义排序字段映射
-        def get_sort_key(paper: Dict[str, Any], field: str):
-            """获取论文的排序键值"""
-            if field == "submittedDate" or field == "published":
-                return paper.get("published", "")
-            elif field == "lastUpdatedDate" or field == "updated":
-                return paper.get("updated", "")
-            elif field == "relevance_score":
-                # 相关度评分（如果有）
-                return paper.get("relevance_score", 0.0)
-            elif field == "title":
-                return paper.get("title", "")
-            else:
-                return ""
-
-        # 构建排序键函数（支持多级排序）
-        # Python sorted是稳定排序，所以需要反向遍历排序条件
-        for sort_config in reversed(multi_sort):
+        # 将各级排序条件合并为一个元组排序键，只需排序一次
+        key_funcs = []
+        for sort_config in multi_sort:
             field = sort_config.get("field", "submittedDate")
             order = sort_config.get("order", "descending")
 
-            reverse = order == "descending"
+            key_func = SORT_KEY_FUNCS.get(field)
+            if key_func is None:
+                self.logger.warning(f"未知的排序字段，已忽略: {field}")
+                continue
 
-            try:
-                papers = sorted(
-                    papers, key=lambda p: get_sort_key(p, field), reverse=reverse
-                )
-                self.logger.debug(f"按 {field} ({order}) 排序完成")
-            except Exception as e:
-                self.logger.warning(f"排序失败 (字段: {field}): {str(e)}")
+            if order == "descending":
+                key_func = _make_descending_key(key_func)
+            key_funcs.append(key_func)
+
+        if not key_funcs:
+            return papers
+
+        try:
+            papers = sorted(
+                papers, key=lambda paper: tuple(func(paper) for func in key_funcs)
+            )
+            self.logger.debug(f"多级排序完成: {len(key_funcs)} 个排序条件")
+        except Exception as e:
+            self.logger.warning(f"多级排序失败: {str(e)}")
 
         return papers
 
     def _get_sort_criterion(self) -> arxiv.SortCriterion:
         """获取排序标准"""
         sort_by = self.arxiv_config.get("sort_by", "submittedDate")
-        sort_map = {
-            "submittedDate": arxiv.SortCriterion.SubmittedDate,
-            "lastUpdatedDate": arxiv.SortCriterion.LastUpdatedDate,
-            "relevance": arxiv.SortCriterion.Relevance,
-        }
-        return sort_map.get(sort_by, arxiv.SortCriterion.SubmittedDate)
+        return ARXIV_SORT_CRITERIA.get(sort_by, arxiv.SortCriterion.SubmittedDate)
 
     def _get_sort_order(self) -> arxiv.SortOrder:
         """获取排序顺序"""
         sort_order = self.arxiv_config.get("sort_order", "descending")
-        order_map = {
-            "descending": arxiv.SortOrder.Descending,
-            "ascending": arxiv.SortOrder.Ascending,
-        }
-        return order_map.get(sort_order, arxiv.SortOrder.Descending)
+        return ARXIV_SORT_ORDERS.get(sort_order, arxiv.SortOrder.Descending)
 
     def _extract_paper_data(self, result: arxiv.Result) -> Dict[str, Any]:
         """
@@ -630,12 +892,15 @@ class ArxivScraper:
             "links": [link.href for link in result.links],
         }
 
-    def save_papers(self, papers: List[Dict[str, Any]]) -> List[str]:
+    def save_papers(
+        self, papers: List[Dict[str, Any]], run_time: Optional[datetime] = None
+    ) -> List[str]:
         """
         保存论文数据
 
         Args:
             papers: 论文列表
+            run_time: 本次运行时间，用于文件名；默认取当前时间
 
         Returns:
             保存的文件路径列表
@@ -645,7 +910,7 @@ class ArxivScraper:
             return []
 
         saved_files = []
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = (run_time or datetime.now()).strftime("%Y%m%d_%H%M%S")
         save_format = self.storage_config.get("format", "both")
 
         # 保存为 JSON
@@ -674,8 +939,8 @@ class ArxivScraper:
         filepath = os.path.join(self.data_dir, filename)
 
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(papers, f, ensure_ascii=False, indent=2)
+            with open(filepath, "wb") as f:
+                f.write(dumps_json_bytes(papers, indent=True))
             self.logger.info(f"已保存 JSON 文件: {filepath}")
             return filepath
         except Exception as e:
@@ -690,17 +955,25 @@ class ArxivScraper:
         filepath = os.path.join(self.data_dir, filename)
 
         try:
-            # 处理列表类型的字段
-            df_data = []
-            for paper in papers:
-                paper_copy = paper.copy()
-                paper_copy["authors"] = "; ".join(paper_copy["authors"])
-                paper_copy["categories"] = "; ".join(paper_copy["categories"])
-                paper_copy["links"] = "; ".join(paper_copy["links"])
-                df_data.append(paper_copy)
-
-            df = pd.DataFrame(df_data)
-            df.to_csv(filepath, index=False, encoding="utf-8")
+            # 各论文字段可能不同，取并集并保持出现顺序
+            fieldnames = list(dict.fromkeys(key for paper in papers for key in paper))
+
+            with open(filepath, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(fieldnames)
+                # 逐行写出，列表类型的字段拼接为字符串；直接按列取值，不复制论文字典
+                for paper in papers:
+                    writer.writerow(
+                        [
+                            (
+                                "; ".join(paper[field] or [])
+                                if field in CSV_LIST_FIELDS and field in paper
+                                else paper.get(field)
+                            )
+                            for field in fieldnames
+                        ]
+                    )
+
             self.logger.info(f"已保存 CSV 文件: {filepath}")
             return filepath
         except Exception as e:
@@ -709,38 +982,96 @@ class ArxivScraper:
 
     def _download_pdfs(self, papers: List[Dict[str, Any]]) -> None:
         """
-        下载论文 PDF
+        下载论文 PDF（并发）
 
         Args:
             papers: 论文列表
         """
         self.logger.info(f"开始下载 {len(papers)} 篇论文的 PDF")
 
-        for i, paper in enumerate(papers, 1):
-            try:
-                arxiv_id = paper["arxiv_id"]
-                pdf_url = paper["pdf_url"]
-                filename = f"{arxiv_id.replace('/', '_')}.pdf"
-                filepath = os.path.join(self.pdf_dir, filename)
-
-                # 如果文件已存在，跳过
-                if os.path.exists(filepath):
-                    self.logger.debug(f"PDF 已存在，跳过: {filename}")
-                    continue
-
-                # 下载 PDF（流式写入）
-                response = self.http_session.get(pdf_url, timeout=30, stream=True)
-                response.raise_for_status()
+        # 一次列出目录代替逐篇 stat，跳过已下载的 PDF
+        try:
+            existing = set(os.listdir(self.pdf_dir))
+        except OSError:
+            existing = set()
+        pending = [
+            paper for paper in papers if self._get_pdf_filename(paper) not in existing
+        ]
+        if len(pending) < len(papers):
+            self.logger.info(f"跳过 {len(papers) - len(pending)} 篇已存在的 PDF")
+        papers = pending
+        if not papers:
+            return
 
-                with open(filepath, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
+        max_workers = max(1, min(self.pdf_max_workers, len(papers)))
 
-                self.logger.info(f"[{i}/{len(papers)}] 已下载 PDF: {filename}")
+        total = len(papers)
+        downloaded = 0
 
-            except Exception as e:
-                self.logger.error(f"下载 PDF 失败 ({paper['arxiv_id']}): {str(e)}")
+        if max_workers == 1:
+            for paper in papers:
+                filename = self._download_single_pdf(paper)
+                if filename:
+                    downloaded += 1
+                    self.logger.info(f"[{downloaded}/{total}] 已下载 PDF: {filename}")
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._download_single_pdf, paper)
+                    for paper in papers
+                ]
+                for future in as_completed(futures):
+                    filename = future.result()
+                    if filename:
+                        downloaded += 1
+                        self.logger.info(
+                            f"[{downloaded}/{total}] 已下载 PDF: {filename}"
+                        )
+
+    def _get_pdf_filename(self, paper: Dict[str, Any]) -> str:
+        """获取论文 PDF 的本地文件名"""
+        return f"{paper.get('arxiv_id', '').replace('/', '_')}.pdf"
+
+    def _download_single_pdf(self, paper: Dict[str, Any]) -> Optional[str]:
+        """
+        下载单篇论文 PDF
+
+        Args:
+            paper: 论文数据
+
+        Returns:
+            新下载的文件名；下载失败时返回 None
+        """
+        try:
+            pdf_url = paper["pdf_url"]
+            filename = self._get_pdf_filename(paper)
+            filepath = os.path.join(self.pdf_dir, filename)
+
+            # 下载 PDF（流式写入，结束后释放连接回连接池）
+            with self.http_session.get(pdf_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+
+                # 先写入临时文件，避免中断后残留的不完整 PDF 被当作已下载
+                temp_path = f"{filepath}.part"
+                try:
+                    with open(temp_path, "wb") as f:
+                        for chunk in response.iter_content(chunk_size=PDF_CHUNK_SIZE):
+                            if chunk:
+                                f.write(chunk)
+                    os.replace(temp_path, filepath)
+                except Exception:
+                    # 下载中断时删除不完整的临时文件，避免在 PDF 目录中堆积
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+                    raise
+
+            return filename
+
+        except Exception as e:
+            self.logger.error(
+                f"下载 PDF 失败 ({paper.get('arxiv_id', 'unknown')}): {str(e)}"
+            )
+            return None
 
     def filter_papers_with_ai(
         self, papers: List[Dict[str, Any]]
@@ -767,6 +1098,25 @@ class ArxivScraper:
 
         filter_threshold = float(ai_config.get("filter_threshold", 0.7))
 
+        # 先用已有的相关度评分做廉价预筛，低分论文不再调用 AI
+        try:
+            prefilter_min_score = float(ai_config.get("prefilter_min_score", 0.0))
+        except (TypeError, ValueError):
+            prefilter_min_score = 0.0
+        if prefilter_min_score > 0:
+            prefiltered = [
+                paper
+                for paper in papers
+                if paper.get("relevance_score", 1.0) >= prefilter_min_score
+            ]
+            if len(prefiltered) != len(papers):
+                self.logger.info(
+                    f"相关度预筛（阈值 {prefilter_min_score}）：{len(papers)} → {len(prefiltered)} 篇论文"
+                )
+            papers = prefiltered
+            if not papers:
+                return papers
+
         # 创建 AI 服务
         ai_service = create_ai_service(ai_config)
         if not ai_service:
@@ -797,58 +1147,36 @@ class ArxivScraper:
         if cached_hits:
             self.logger.info(f"筛选缓存命中: {cached_hits} 篇论文")
 
+        def filter_single(paper: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                return ai_service.filter_paper(paper, filter_keywords)
+            except Exception as e:
+                self.logger.error(
+                    f"筛选失败 ({paper.get('arxiv_id', 'unknown')}): {str(e)}"
+                )
+                return {
+                    "relevant": True,
+                    "confidence": 0.5,
+                    "reason": f"筛选失败: {str(e)}",
+                    "status": "error",
+                }
+
         if papers_to_filter:
             max_workers = self._get_max_workers(ai_config, len(papers_to_filter))
             self.logger.info(f"并发筛选: {max_workers} 线程")
 
             if max_workers == 1:
                 for i, paper in enumerate(papers_to_filter, 1):
-                    try:
-                        self.logger.info(
-                            f"[{i}/{len(papers_to_filter)}] 筛选: {paper['title'][:50]}..."
-                        )
-                        filter_result = ai_service.filter_paper(paper, filter_keywords)
-                    except Exception as e:
-                        self.logger.error(
-                            f"筛选失败 ({paper.get('arxiv_id', 'unknown')}): {str(e)}"
-                        )
-                        filter_result = {
-                            "relevant": True,
-                            "confidence": 0.5,
-                            "reason": f"筛选失败: {str(e)}",
-                            "status": "error",
-                        }
-
-                    paper["filter_result"] = filter_result
-                    if filter_result.get("status") == "success":
-                        self._update_cache_entry(paper, filter_result=filter_result)
+                    self.logger.info(
+                        f"[{i}/{len(papers_to_filter)}] 筛选: {paper['title'][:50]}..."
+                    )
+                    self._apply_filter_result(paper, filter_single(paper))
             else:
+                # executor.map 按提交顺序返回结果，缓存更新仍在主线程中进行
                 with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    future_to_paper = {
-                        executor.submit(
-                            ai_service.filter_paper, paper, filter_keywords
-                        ): paper
-                        for paper in papers_to_filter
-                    }
-
-                    for future in as_completed(future_to_paper):
-                        paper = future_to_paper[future]
-                        try:
-                            filter_result = future.result()
-                        except Exception as e:
-                            self.logger.error(
-                                f"筛选失败 ({paper.get('arxiv_id', 'unknown')}): {str(e)}"
-                            )
-                            filter_result = {
-                                "relevant": True,
-                                "confidence": 0.5,
-                                "reason": f"筛选失败: {str(e)}",
-                                "status": "error",
-                            }
-
-                        paper["filter_result"] = filter_result
-                        if filter_result.get("status") == "success":
-                            self._update_cache_entry(paper, filter_result=filter_result)
+                    results = executor.map(filter_single, papers_to_filter)
+                    for paper, filter_result in zip(papers_to_filter, results):
+                        self._apply_filter_result(paper, filter_result)
 
         filtered_papers = []
         for paper in papers:
@@ -913,7 +1241,7 @@ class ArxivScraper:
                     cached_summary += 1
                     needs_summary = False
 
-            needs_translation = enable_translation and paper.get("summary")
+            needs_translation = enable_translation and bool(paper.get("summary"))
             if enable_translation and cache_valid:
                 cached = cache_entry.get("translation")
                 if cached and not str(cached).startswith("翻译失败"):
@@ -937,119 +1265,97 @@ class ArxivScraper:
                 f"AI 缓存命中: 总结 {cached_summary}，翻译 {cached_translation}，洞察 {cached_insights}"
             )
 
-        def process_single(task):
+        def process_single(task) -> Dict[str, Any]:
             paper, do_summary, do_translation, do_insights = task
-            result = {}
-            if do_summary:
-                result["ai_summary"] = ai_service.summarize_paper(paper)
-            if do_translation:
-                result["translation"] = ai_service.translate_text(
-                    paper.get("summary", "")
+            try:
+                result = ai_service.process_paper(
+                    paper, do_summary, do_translation, do_insights
                 )
-            if do_insights:
-                result["insights"] = ai_service.extract_insights(paper)
-            return paper, result
+            except Exception as e:
+                self.logger.error(
+                    f"AI 处理失败 ({paper.get('arxiv_id', 'unknown')}): {str(e)}"
+                )
+                result = {}
+                if do_summary:
+                    result["ai_summary"] = {
+                        "summary": f"处理失败: {str(e)}",
+                        "status": "error",
+                    }
+                if do_translation:
+                    result["translation"] = f"翻译失败: {str(e)}"
+                if do_insights:
+                    result["insights"] = {
+                        "insights": [],
+                        "status": "error",
+                        "error": str(e),
+                    }
+            return result
 
         if tasks:
             max_workers = self._get_max_workers(ai_config, len(tasks))
             if max_workers == 1:
                 for i, task in enumerate(tasks, 1):
                     paper = task[0]
-                    try:
-                        self.logger.info(
-                            f"[{i}/{len(tasks)}] 处理: {paper['title'][:50]}..."
-                        )
-                        _, result = process_single(task)
-                    except Exception as e:
-                        self.logger.error(
-                            f"AI 处理失败 ({paper.get('arxiv_id', 'unknown')}): {str(e)}"
-                        )
-                        result = {}
-                        if task[1]:
-                            result["ai_summary"] = {
-                                "summary": f"处理失败: {str(e)}",
-                                "status": "error",
-                            }
-                        if task[2]:
-                            result["translation"] = f"翻译失败: {str(e)}"
-                        if task[3]:
-                            result["insights"] = {
-                                "insights": [],
-                                "status": "error",
-                                "error": str(e),
-                            }
-
-                    for key, value in result.items():
-                        paper[key] = value
-
-                    if result.get("ai_summary", {}).get("status") == "success":
-                        self._update_cache_entry(paper, ai_summary=result["ai_summary"])
-                    if "translation" in result and not str(
-                        result["translation"]
-                    ).startswith("翻译失败"):
-                        self._update_cache_entry(
-                            paper, translation=result["translation"]
-                        )
-                    if result.get("insights", {}).get("status") == "success":
-                        self._update_cache_entry(paper, insights=result["insights"])
+                    self.logger.info(
+                        f"[{i}/{len(tasks)}] 处理: {paper['title'][:50]}..."
+                    )
+                    self._apply_ai_result(paper, process_single(task))
             else:
+                # 未启用合并处理时，把每篇论文的总结/翻译/洞察拆成独立任务，
+                # 论文数少于线程数时也能并发执行；总并发仍受 max_workers 限制
+                if not ai_service.combined_processing:
+                    subtasks = []
+                    for paper, do_summary, do_translation, do_insights in tasks:
+                        if do_summary:
+                            subtasks.append((paper, True, False, False))
+                        if do_translation:
+                            subtasks.append((paper, False, True, False))
+                        if do_insights:
+                            subtasks.append((paper, False, False, True))
+                    tasks = subtasks
+                    max_workers = self._get_max_workers(ai_config, len(tasks))
+
                 self.logger.info(f"并发处理: {max_workers} 线程")
+                # executor.map 按提交顺序返回结果，缓存更新仍在主线程中进行
                 with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    future_to_task = {
-                        executor.submit(process_single, task): task for task in tasks
-                    }
-
-                    for future in as_completed(future_to_task):
-                        task = future_to_task[future]
-                        paper = task[0]
-                        try:
-                            _, result = future.result()
-                        except Exception as e:
-                            self.logger.error(
-                                f"AI 处理失败 ({paper.get('arxiv_id', 'unknown')}): {str(e)}"
-                            )
-                            result = {}
-                            if task[1]:
-                                result["ai_summary"] = {
-                                    "summary": f"处理失败: {str(e)}",
-                                    "status": "error",
-                                }
-                            if task[2]:
-                                result["translation"] = f"翻译失败: {str(e)}"
-                            if task[3]:
-                                result["insights"] = {
-                                    "insights": [],
-                                    "status": "error",
-                                    "error": str(e),
-                                }
-
-                        for key, value in result.items():
-                            paper[key] = value
-
-                        if result.get("ai_summary", {}).get("status") == "success":
-                            self._update_cache_entry(
-                                paper, ai_summary=result["ai_summary"]
-                            )
-                        if "translation" in result and not str(
-                            result["translation"]
-                        ).startswith("翻译失败"):
-                            self._update_cache_entry(
-                                paper, translation=result["translation"]
-                            )
-                        if result.get("insights", {}).get("status") == "success":
-                            self._update_cache_entry(paper, insights=result["insights"])
+                    results = executor.map(process_single, tasks)
+                    for task, result in zip(tasks, results):
+                        self._apply_ai_result(task[0], result)
 
         self.logger.info("AI 处理完成")
         return papers
 
+    def _apply_filter_result(
+        self, paper: Dict[str, Any], filter_result: Dict[str, Any]
+    ) -> None:
+        """将筛选结果写回论文并更新缓存"""
+        paper["filter_result"] = filter_result
+        if filter_result.get("status") == "success":
+            self._update_cache_entry(paper, filter_result=filter_result)
+
+    def _apply_ai_result(self, paper: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """将 AI 处理结果写回论文并更新缓存"""
+        for key, value in result.items():
+            paper[key] = value
+
+        if result.get("ai_summary", {}).get("status") == "success":
+            self._update_cache_entry(paper, ai_summary=result["ai_summary"])
+        if "translation" in result and not str(result["translation"]).startswith(
+            "翻译失败"
+        ):
+            self._update_cache_entry(paper, translation=result["translation"])
+        if result.get("insights", {}).get("status") == "success":
+            self._update_cache_entry(paper, insights=result["insights"])
+
     def generate_and_send_markdown_report(
-        self, papers: List[Dict[str, Any]]
+        self, papers: List[Dict[str, Any]], run_time: Optional[datetime] = None
     ) -> Optional[str]:
         """
         生成 Markdown 报告并发送邮件
 
         Args:
             papers: 论文列表（已包含 AI 处理结果）
+            run_time: 本次运行时间，用于文件名和邮件内容；默认取当前时间
 
         Returns:
             Markdown 文件路径，如果失败则返回 None
@@ -1060,6 +1366,9 @@ class ArxivScraper:
             self.logger.debug("Markdown 报告发送未启用")
             return None
 
+        notification_config = self.config.get("notification", {})
+        notification_enabled = notification_config.get("enabled", False)
+
         try:
             # 创建 Markdown 生成器
             generator = MarkdownGenerator()
@@ -1081,7 +1390,8 @@ class ArxivScraper:
             markdown_dir = ai_config.get("markdown_dir", "./data/reports")
             os.makedirs(markdown_dir, exist_ok=True)
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            run_time = run_time or datetime.now()
+            timestamp = run_time.strftime("%Y%m%d_%H%M%S")
             filename = f"arxiv_report_{timestamp}.md"
             filepath = os.path.join(markdown_dir, filename)
 
@@ -1089,8 +1399,7 @@ class ArxivScraper:
                 self.logger.info(f"Markdown 报告已保存: {filepath}")
 
                 # 发送报告
-                notification_config = self.config.get("notification", {})
-                if notification_config.get("enabled", False):
+                if notification_enabled:
                     method = notification_config.get("method")
                     success = False
 
@@ -1105,7 +1414,7 @@ class ArxivScraper:
 详情请查看附件中的 Markdown 文档。
 
 ---
-自动生成于 {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+自动生成于 {run_time.strftime("%Y-%m-%d %H:%M:%S")}
 """
 
                         attachments = [{"file_path": filepath, "filename": filename}]
@@ -1115,7 +1424,7 @@ class ArxivScraper:
                         success = send_email_with_retry(
                             email_config,
                             message,
-                            f"ArXiv 论文日报 - {datetime.now().strftime('%Y-%m-%d')}",
+                            f"ArXiv 论文日报 - {run_time.strftime('%Y-%m-%d')}",
                             attachments,
                             max_retries=3,
                             retry_delay=5,
@@ -1163,6 +1472,8 @@ class ArxivScraper:
         """
         saved_paper_files = []
         papers: List[Dict[str, Any]] = []
+        # 本次运行的各输出文件共用同一时间戳
+        run_time = datetime.now()
 
         try:
             self.logger.info("=" * 50)
@@ -1186,17 +1497,19 @@ class ArxivScraper:
 
             # 保存论文（包含 AI 处理结果）
             if papers:
-                saved_paper_files = self.save_papers(papers)
+                saved_paper_files = self.save_papers(papers, run_time)
 
             # 生成并发送 Markdown 报告
             markdown_path = None
             email_sent = False
             if papers:
-                markdown_path = self.generate_and_send_markdown_report(papers)
+                markdown_path = self.generate_and_send_markdown_report(papers, run_time)
                 # 如果 markdown_path 为 None，说明邮件发送成功且已删除
                 # 如果 markdown_path 不为 None，说明未发送或发送失败
-                email_sent = markdown_path is None and self.config.get("ai", {}).get(
-                    "send_markdown_report", False
+                email_sent = (
+                    markdown_path is None
+                    and self.config.get("ai", {}).get("send_markdown_report", False)
+                    and self.config.get("notification", {}).get("enabled", False)
                 )
 
             # 如果启用了自动清理且邮件发送成功，删除 paper 文件
@@ -4,12 +4,19 @@
 支持环境变量覆盖敏感配置
 """
 
+import copy
+import functools
 import os
 import re
+import types
 import yaml
 import logging
-from typing import Dict, Any
+from typing import IO, Dict, Any, Tuple, Union
 
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:  # PyYAML 未编译 libyaml 扩展时回退到纯 Python 实现
+    from yaml import SafeLoader as _YAMLLoader
 
 # 环境变量映射表：环境变量名 -> 配置路径
 ENV_VAR_MAPPING = {
@@ -22,85 +29,141 @@ ENV_VAR_MAPPING = {
 }
 
 
+# 环境变量引用：${VAR_NAME} 或 $VAR_NAME
+ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}|\$([A-Z_][A-Z0-9_]*)")
+
+
+def _load_yaml_file(path: str) -> Any:
+    """读取并解析 YAML 文件"""
+    # 一次性读入全部字节再交给解析器（由其自行识别编码），
+    # 避免 libyaml 通过 Python 文件对象分块回调读取
+    with open(path, "rb") as f:
+        return yaml.load(f.read(), Loader=_YAMLLoader)
+
+
+def _freeze(value: Any) -> Any:
+    """递归转换为只读结构（dict -> MappingProxyType，list -> tuple）"""
+    if isinstance(value, dict):
+        return types.MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """_freeze 的逆操作，返回可修改的普通 dict/list 副本"""
+    if isinstance(value, types.MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+@functools.lru_cache(maxsize=256)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """将点号分隔的配置路径拆分为键元组（按路径缓存）"""
+    return tuple(path.split("."))
+
+
+def _env_var_replacer(match: re.Match[str]) -> str:
+    """将匹配到的环境变量引用替换为其值，未设置时保留原文"""
+    var_name = match.group(1) or match.group(2)
+    return os.environ.get(var_name, match.group(0))
+
+
 def _resolve_env_vars(value: str) -> str:
     """
     解析字符串中的环境变量引用 ${VAR_NAME} 或 $VAR_NAME
     """
-    if not isinstance(value, str):
+    # 绝大多数配置值不含 "$"，先做一次子串判断，避免进入正则匹配
+    if not isinstance(value, str) or "$" not in value:
         return value
 
-    pattern = r"\$\{([^}]+)\}|\$([A-Z_][A-Z0-9_]*)"
+    return ENV_VAR_PATTERN.sub(_env_var_replacer, value)
 
-    def replacer(match: re.Match[str]) -> str:
-        var_name = match.group(1) or match.group(2)
-        return os.environ.get(var_name, match.group(0))
 
-    return re.sub(pattern, replacer, value)
-
-
-def _apply_env_vars_recursive(config: Dict[str, Any]) -> Dict[str, Any]:
+def _apply_env_vars(config: Dict[str, Any]) -> Dict[str, Any]:
     """
-    递归处理配置中的环境变量引用
+    处理配置中的环境变量引用（原地修改并返回 config）
+
+    用显式栈遍历嵌套字典，避免逐层递归调用
     """
-    result = {}
-    for key, value in config.items():
-        if isinstance(value, dict):
-            result[key] = _apply_env_vars_recursive(value)
-        elif isinstance(value, str):
-            result[key] = _resolve_env_vars(value)
-        elif isinstance(value, list):
-            result[key] = [
-                _resolve_env_vars(v) if isinstance(v, str) else v for v in value
-            ]
-        else:
-            result[key] = value
-    return result
+    stack = [config]
+    while stack:
+        node = stack.pop()
+        for key, value in node.items():
+            if isinstance(value, dict):
+                # repr 在 C 层一次展开整个子树，其中不含 "$" 时不可能有环境变量引用，整体跳过
+                if "$" in repr(value):
+                    stack.append(value)
+            elif isinstance(value, str):
+                node[key] = _resolve_env_vars(value)
+            elif isinstance(value, list):
+                node[key] = [
+                    _resolve_env_vars(v) if isinstance(v, str) else v for v in value
+                ]
+    return config
 
 
 class ConfigManager:
     """配置管理器"""
 
-    # 默认配置
-    DEFAULT_CONFIG = {
-        "arxiv": {
-            "keywords": ["machine learning"],
-            "categories": [],
-            "max_results": 50,
-            "sort_by": "submittedDate",
-            "sort_order": "descending",
-        },
-        "schedule": {"enabled": False, "time": "09:00"},
-        "storage": {
-            "data_dir": "./data/papers",
-            "format": "both",
-            "download_pdf": False,
-            "pdf_dir": "./data/pdfs",
-            "cache_enabled": True,
-            "cache_file": "./data/papers/cache.json",
-            "cache_max_items": 5000,
-            "skip_processed": False,
-        },
-        "logging": {
-            "level": "INFO",
-            "file": "./logs/arxiv_scraper.log",
-            "console": True,
-            "max_size": 10,
-            "backup_count": 5,
-        },
-        "notification": {"enabled": False, "method": "email"},
-    }
-
-    def __init__(self, config_path: str = "config.yaml"):
+    # 默认配置（逐层只读，使用时通过 _get_default_config 取可修改的副本）
+    DEFAULT_CONFIG = _freeze(
+        {
+            "arxiv": {
+                "keywords": ["machine learning"],
+                "categories": [],
+                "max_results": 50,
+                "sort_by": "submittedDate",
+                "sort_order": "descending",
+            },
+            "schedule": {"enabled": False, "time": "09:00"},
+            "storage": {
+                "data_dir": "./data/papers",
+                "format": "both",
+                "download_pdf": False,
+                "pdf_dir": "./data/pdfs",
+                "pdf_max_workers": 4,
+                "cache_enabled": True,
+                "cache_file": "./data/papers/cache.json",
+                "cache_max_items": 5000,
+                "search_cache_enabled": False,
+                "search_cache_dir": "./data/.cache",
+                "skip_processed": False,
+            },
+            "logging": {
+                "level": "INFO",
+                "file": "./logs/arxiv_scraper.log",
+                "console": True,
+                "max_size": 10,
+                "backup_count": 5,
+            },
+            "notification": {"enabled": False, "method": "email"},
+        }
+    )
+
+    def __init__(self, config_path: Union[str, os.PathLike, IO] = "config.yaml"):
         """
         初始化配置管理器
 
         Args:
-            config_path: 配置文件路径
+            config_path: 配置文件路径，也可以是已打开的 YAML 文本/二进制流
         """
         self.config_path = config_path
         self.logger = logging.getLogger(__name__)
+        # 数据流只能读取一次，保留其解析结果供 reload() 复用
+        self._stream_config = None
         self.config = self._load_config()
 
+    def _is_file_backed(self) -> bool:
+        """配置是否来自文件路径（而非数据流）"""
+        return isinstance(self.config_path, (str, os.PathLike))
+
+    def _get_default_config(self) -> Dict[str, Any]:
+        """获取默认配置的独立可修改副本"""
+        return _thaw(self.DEFAULT_CONFIG)
+
     def _load_config(self) -> Dict[str, Any]:
         """
         加载配置文件
@@ -108,21 +171,31 @@ class ConfigManager:
         Returns:
             配置字典
         """
-        if not os.path.exists(self.config_path):
+        is_path = self._is_file_backed()
+        if is_path and not os.path.exists(self.config_path):
             self.logger.warning(f"配置文件不存在: {self.config_path}，使用默认配置")
-            return self.DEFAULT_CONFIG.copy()
+            return self._get_default_config()
 
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                user_config = yaml.safe_load(f)
+            if is_path:
+                user_config = _load_yaml_file(self.config_path)
+            else:
+                if self._stream_config is None:
+                    self._stream_config = yaml.load(
+                        self.config_path, Loader=_YAMLLoader
+                    )
+                # 合并和环境变量处理会原地修改，使用副本
+                user_config = copy.deepcopy(self._stream_config)
 
             if user_config is None:
                 self.logger.warning("配置文件为空，使用默认配置")
-                return self.DEFAULT_CONFIG.copy()
+                return self._get_default_config()
 
-            config = self._merge_config(self.DEFAULT_CONFIG, user_config)
+            # 在默认配置的副本上合并，合并结果不与 DEFAULT_CONFIG 共享嵌套字典
+            config = self._merge_config(self._get_default_config(), user_config)
 
-            config = _apply_env_vars_recursive(config)
+            # 合并结果是独立副本（默认配置深拷贝 + 新解析的用户配置），可原地处理
+            config = _apply_env_vars(config)
 
             config = self._apply_env_var_overrides(config)
 
@@ -135,12 +208,12 @@ class ConfigManager:
         except yaml.YAMLError as e:
             self.logger.error(f"解析配置文件失败: {str(e)}")
             self.logger.warning("使用默认配置")
-            return self.DEFAULT_CONFIG.copy()
+            return self._get_default_config()
 
         except Exception as e:
             self.logger.error(f"加载配置文件时出错: {str(e)}")
             self.logger.warning("使用默认配置")
-            return self.DEFAULT_CONFIG.copy()
+            return self._get_default_config()
 
     def _apply_env_var_overrides(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """通过环境变量覆盖配置值"""
@@ -153,12 +226,10 @@ class ConfigManager:
 
     def _set_nested(self, config: Dict[str, Any], path: str, value: Any) -> None:
         """设置嵌套配置值"""
-        keys = path.split(".")
+        keys = _split_path(path)
         current = config
         for key in keys[:-1]:
-            if key not in current:
-                current[key] = {}
-            current = current[key]
+            current = current.setdefault(key, {})
         current[keys[-1]] = value
 
     def _merge_config(
@@ -243,10 +314,9 @@ class ConfigManager:
         if key is None:
             return self.config
 
-        keys = key.split(".")
         value = self.config
 
-        for k in keys:
+        for k in _split_path(key):
             if isinstance(value, dict):
                 value = value.get(k)
                 if value is None:
@@ -264,15 +334,7 @@ class ConfigManager:
             key: 配置键（支持点号分隔的路径）
             value: 配置值
         """
-        keys = key.split(".")
-        config = self.config
-
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
-
-        config[keys[-1]] = value
+        self._set_nested(self.config, key, value)
 
     def save(self, path: str = None) -> None:
         """
@@ -280,7 +342,13 @@ class ConfigManager:
 
         Args:
             path: 保存路径，默认使用加载时的路径
+
+        Raises:
+            ValueError: 配置来自数据流且未指定保存路径时抛出
         """
+        if path is None and not self._is_file_backed():
+            raise ValueError("配置是从数据流加载的，保存时必须指定 path")
+
         save_path = path or self.config_path
 
         try:
@@ -293,7 +361,7 @@ class ConfigManager:
             raise
 
     def reload(self) -> None:
-        """重新加载配置文件"""
+        """重新加载配置文件（从数据流加载的配置复用首次解析的内容）"""
         self.config = self._load_config()
         self.logger.info("配置已重新加载")
 
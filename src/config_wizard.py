@@ -4,9 +4,23 @@
 """
 
 import os
+import shutil
 from typing import Dict, Any, List, Optional, Tuple
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YAMLDumper
+except ImportError:  # PyYAML 未编译 libyaml 扩展时回退到纯 Python 实现
+    from yaml import SafeDumper as _YAMLDumper
+
+# 向导生成的配置文件头注释
+CONFIG_FILE_HEADER = (
+    "# =====================================================\n"
+    "# ArXiv 论文抓取工具 - 配置文件\n"
+    "# 由交互式配置向导生成\n"
+    "# =====================================================\n\n"
+)
+
 
 class ConfigWizard:
     """交互式配置向导"""
@@ -39,6 +53,12 @@ class ConfigWizard:
         "3": ("none", "不启用通知"),
     }
 
+    # 视为"是"的输入
+    YES_ANSWERS = frozenset(("y", "yes", "是", "对", "true", "1"))
+
+    # 将中文逗号统一为英文逗号，用于拆分多项输入
+    COMMA_TRANS = str.maketrans("，", ",")
+
     def __init__(self):
         """初始化配置向导"""
         self.config: Dict[str, Any] = {}
@@ -101,7 +121,7 @@ class ConfigWizard:
         result = input(f"{prompt} ({default_str}): ").strip().lower()
         if not result:
             return default
-        return result in ("y", "yes", "是", "对", "true", "1")
+        return result in self.YES_ANSWERS
 
     def _input_choice(
         self,
@@ -110,19 +130,21 @@ class ConfigWizard:
         allow_multiple: bool = False,
     ) -> List[str]:
         """选择输入"""
-        print(f"\n{prompt}")
-        for key, (value, desc) in choices.items():
-            print(f"  {key}. {desc} ({value})")
+        # 整个菜单拼接后一次输出
+        menu = "\n".join(
+            f"  {key}. {desc} ({value})" for key, (value, desc) in choices.items()
+        )
+        print(f"\n{prompt}\n{menu}")
 
         if allow_multiple:
             print("\n提示: 可输入多个选项，用逗号分隔，如: 1,2,3")
             result = input("\n请选择: ").strip()
-            selected = []
-            for choice in result.replace("，", ",").split(","):
-                choice = choice.strip()
-                if choice in choices:
-                    selected.append(choices[choice][0])
-            return selected if selected else [choices["1"][0]]
+            tokens = (
+                choice.strip()
+                for choice in result.translate(self.COMMA_TRANS).split(",")
+            )
+            selected = [choices[choice][0] for choice in tokens if choice in choices]
+            return selected or [choices["1"][0]]
         else:
             result = input("\n请选择: ").strip()
             if result in choices:
@@ -141,7 +163,7 @@ class ConfigWizard:
         keywords_str = self._input("搜索关键词", "machine learning, deep learning")
         keywords = [
             kw.strip()
-            for kw in keywords_str.replace("，", ",").split(",")
+            for kw in keywords_str.translate(self.COMMA_TRANS).split(",")
             if kw.strip()
         ]
 
@@ -162,7 +184,7 @@ class ConfigWizard:
         # 相关度评分
         enable_relevance = self._input_yes_no("是否启用相关度评分（推荐）", True)
 
-        self.config["arxiv"] = {
+        arxiv_config = {
             "keywords": keywords,
             "categories": categories,
             "max_results": max_results,
@@ -173,11 +195,13 @@ class ConfigWizard:
 
         # 多级排序
         if enable_relevance:
-            self.config["arxiv"]["multi_level_sort"] = [
+            arxiv_config["multi_level_sort"] = [
                 {"field": "relevance_score", "order": "descending"},
                 {"field": "submittedDate", "order": "descending"},
             ]
 
+        self.config["arxiv"] = arxiv_config
+
         print("\n✅ ArXiv 搜索配置完成")
         return True
 
@@ -393,7 +417,9 @@ class ConfigWizard:
         print("\n收件人邮箱（多个用逗号分隔）")
         recipients_str = self._input("收件人", sender)
         recipients = [
-            r.strip() for r in recipients_str.replace("，", ",").split(",") if r.strip()
+            r.strip()
+            for r in recipients_str.translate(self.COMMA_TRANS).split(",")
+            if r.strip()
         ]
 
         return {
@@ -505,8 +531,7 @@ class ConfigWizard:
         }
 
         # 打印配置预览
-        preview = yaml.dump(self.config, default_flow_style=False, allow_unicode=True)
-        print(preview)
+        print(_dump_config_yaml(self.config))
 
         print("=" * 60)
 
@@ -523,24 +548,51 @@ def run_config_wizard() -> Optional[Dict[str, Any]]:
     return wizard.run()
 
 
+def _dump_config_yaml(config: Dict[str, Any]) -> str:
+    """
+    将配置序列化为 YAML 文本（预览和保存共用，保证两者一致）
+
+    保持向导中各配置项的填写顺序，不做键排序
+    """
+    return yaml.dump(
+        config,
+        Dumper=_YAMLDumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+    )
+
+
 def save_config(config: Dict[str, Any], path: str = "config.yaml") -> bool:
     """保存配置到文件"""
     try:
+        # 符号链接指向的真实文件（备份和替换都针对它）
+        target_path = os.path.realpath(path)
+
         # 备份现有配置
-        if os.path.exists(path):
+        if os.path.exists(target_path):
             backup_path = f"{path}.backup"
-            import shutil
-
-            shutil.copy(path, backup_path)
+            # 新配置通过替换文件写入，不会修改原文件内容，硬链接即可保留旧配置；
+            # 文件系统不支持硬链接时回退为复制
+            try:
+                if os.path.lexists(backup_path):
+                    os.remove(backup_path)
+                os.link(target_path, backup_path)
+            except OSError:
+                shutil.copy(target_path, backup_path)
             print(f"\n💾 已备份现有配置到: {backup_path}")
 
-        with open(path, "w", encoding="utf-8") as f:
-            # 添加文件头注释
-            f.write("# =====================================================\n")
-            f.write("# ArXiv 论文抓取工具 - 配置文件\n")
-            f.write("# 由交互式配置向导生成\n")
-            f.write("# =====================================================\n\n")
-            yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
+        # 文件头注释与配置内容拼接后一次写入
+        content = CONFIG_FILE_HEADER + _dump_config_yaml(config)
+
+        # 先写入临时文件再替换，避免写入中断导致配置文件损坏；
+        # 并沿用原文件权限（配置中含 API 密钥等敏感信息）
+        temp_path = f"{target_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            if os.path.exists(target_path):
+                shutil.copymode(target_path, temp_path)
+            f.write(content)
+        os.replace(temp_path, target_path)
 
         print(f"\n✅ 配置已保存到: {path}")
         return True
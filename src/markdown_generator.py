@@ -3,9 +3,99 @@ Markdown 生成模块
 将论文数据和 AI 总结生成格式化的 Markdown 文档
 """
 
+import functools
 import logging
-from typing import List, Dict, Any
+import re
+from typing import List, Dict, Any, Optional
 from datetime import datetime
+from dateutil import parser as date_parser
+
+try:
+    import markdown
+except ImportError:  # 可选依赖，仅 HTML 转换需要
+    markdown = None
+
+# slug 中需要移除的字符：字母、数字和空白之外的所有字符（\w 包含下划线，单独移除）
+SLUG_STRIP_PATTERN = re.compile(r"[^\w\s]|_")
+
+# HTML 文档模板（{body} 处填入正文）
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>ArXiv 论文日报</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
+            line-height: 1.6;
+            max-width: 900px;
+            margin: 0 auto;
+            padding: 20px;
+            color: #333;
+        }
+        h1, h2, h3 {
+            color: #2c3e50;
+            border-bottom: 2px solid #3498db;
+            padding-bottom: 10px;
+        }
+        h1 { font-size: 2.5em; }
+        h2 { font-size: 2em; margin-top: 40px; }
+        h3 { font-size: 1.5em; margin-top: 30px; }
+        blockquote {
+            border-left: 4px solid #3498db;
+            padding-left: 20px;
+            margin: 20px 0;
+            color: #555;
+            background-color: #f9f9f9;
+            padding: 15px;
+        }
+        code {
+            background-color: #f4f4f4;
+            padding: 2px 6px;
+            border-radius: 3px;
+            font-family: 'Courier New', monospace;
+        }
+        a {
+            color: #3498db;
+            text-decoration: none;
+        }
+        a:hover {
+            text-decoration: underline;
+        }
+        hr {
+            border: none;
+            border-top: 2px solid #eee;
+            margin: 40px 0;
+        }
+        ul {
+            padding-left: 20px;
+        }
+        li {
+            margin: 10px 0;
+        }
+    </style>
+</head>
+<body>
+{body}
+</body>
+</html>"""
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_date(value: str) -> str:
+    """将日期字符串格式化为 YYYY-MM-DD，无法解析时原样返回（结果按输入缓存）"""
+    # ArXiv 时间戳为标准 ISO-8601 格式，优先走 fromisoformat 快速路径
+    try:
+        iso_value = value[:-1] + "+00:00" if value.endswith("Z") else value
+        return datetime.fromisoformat(iso_value).strftime("%Y-%m-%d")
+    except (ValueError, TypeError, AttributeError):
+        pass
+
+    try:
+        return date_parser.parse(value).strftime("%Y-%m-%d")
+    except (ValueError, TypeError, OverflowError):
+        return value
 
 
 class MarkdownGenerator:
@@ -14,6 +104,8 @@ class MarkdownGenerator:
     def __init__(self):
         """初始化生成器"""
         self.logger = logging.getLogger(__name__)
+        # Markdown 转换器（首次转换 HTML 时创建，之后复用以免重复加载扩展）
+        self._md = None
 
     def generate_paper_summary(
         self,
@@ -34,6 +126,8 @@ class MarkdownGenerator:
             Markdown 格式的文档内容
         """
         lines = []
+        # 锚点只计算一次，目录和正文共用
+        anchors = self._make_anchor_ids(papers)
 
         # 标题
         lines.append("# ArXiv 论文日报")
@@ -47,22 +141,28 @@ class MarkdownGenerator:
         # 目录
         lines.append("## 目录")
         lines.append("")
-        for i, paper in enumerate(papers, 1):
+        for i, (paper, anchor) in enumerate(zip(papers, anchors), 1):
             title = paper.get("title", "N/A")
             # 清理标题中的特殊字符
             title = title.replace("[", "").replace("]", "").replace("#", "")
-            anchor = self._make_anchor_id(paper, i)
             lines.append(f"{i}. [{title}](#{anchor})")
         lines.append("")
         lines.append("---")
         lines.append("")
 
         # 论文详情
-        for i, paper in enumerate(papers, 1):
-            paper_md = self._generate_single_paper(
-                paper, i, include_ai_summary, include_translation, include_insights
+        for i, (paper, anchor) in enumerate(zip(papers, anchors), 1):
+            # 直接并入同一个行列表，避免每篇论文先单独拼接一次字符串
+            lines.extend(
+                self._single_paper_lines(
+                    paper,
+                    i,
+                    include_ai_summary,
+                    include_translation,
+                    include_insights,
+                    anchor,
+                )
             )
-            lines.append(paper_md)
             lines.append("")
             lines.append("---")
             lines.append("")
@@ -79,32 +179,21 @@ class MarkdownGenerator:
 
         return "\n".join(lines)
 
-    def _generate_single_paper(
+    def _single_paper_lines(
         self,
         paper: Dict[str, Any],
         index: int,
         include_ai_summary: bool,
         include_translation: bool,
-        include_insights: bool = True,
-    ) -> str:
-        """
-        生成单篇论文的 Markdown
-
-        Args:
-            paper: 论文数据
-            index: 论文序号
-            include_ai_summary: 是否包含 AI 总结
-            include_translation: 是否包含翻译
-            include_insights: 是否包含关键洞察
-
-        Returns:
-            单篇论文的 Markdown 内容
-        """
+        include_insights: bool,
+        anchor: Optional[str] = None,
+    ) -> List[str]:
+        """生成单篇论文的 Markdown 行列表（未传入锚点时自行生成）"""
         lines = []
 
         # 标题
         title = paper.get("title", "N/A")
-        anchor = self._make_anchor_id(paper, index)
+        anchor = anchor or self._make_anchor_id(paper, index)
         lines.append(f'<a id="{anchor}"></a>')
         lines.append(f"## {index}. {title}")
         lines.append("")
@@ -135,18 +224,12 @@ class MarkdownGenerator:
         # 发布时间
         published = paper.get("published", "N/A")
         if published != "N/A":
-            try:
-                from dateutil import parser
-
-                pub_date = parser.parse(published)
-                lines.append(f"- **发布时间**: {pub_date.strftime('%Y-%m-%d')}")
-            except (ValueError, TypeError):
-                lines.append(f"- **发布时间**: {published}")
+            lines.append(f"- **发布时间**: {_format_date(published)}")
 
         # 分类
         categories = paper.get("categories", [])
         if categories:
-            cat_badges = " ".join([f"`{cat}`" for cat in categories[:5]])
+            cat_badges = " ".join(f"`{cat}`" for cat in categories[:5])
             lines.append(f"- **分类**: {cat_badges}")
 
         lines.append("")
@@ -208,7 +291,7 @@ class MarkdownGenerator:
         journal_ref = paper.get("journal_ref")
         doi = paper.get("doi")
 
-        if any([comment, journal_ref, doi]):
+        if comment or journal_ref or doi:
             lines.append("### ℹ️ 其他信息")
             lines.append("")
             if comment:
@@ -219,7 +302,7 @@ class MarkdownGenerator:
                 lines.append(f"- **DOI**: [{doi}](https://doi.org/{doi})")
             lines.append("")
 
-        return "\n".join(lines)
+        return lines
 
     def _slugify(self, text: str) -> str:
         """
@@ -232,8 +315,7 @@ class MarkdownGenerator:
             slug 格式的文本
         """
         # 简单实现：移除特殊字符，替换空格为连字符
-        text = text.lower()
-        text = "".join(c if c.isalnum() or c.isspace() else "" for c in text)
+        text = SLUG_STRIP_PATTERN.sub("", text.lower())
         text = "-".join(text.split())
         return text[:50]  # 限制长度
 
@@ -255,6 +337,30 @@ class MarkdownGenerator:
         title = paper.get("title", "N/A")
         return f"paper-{index}-{self._slugify(title)}"
 
+    def _make_anchor_ids(self, papers: List[Dict[str, Any]]) -> List[str]:
+        """
+        为论文列表生成互不重复的锚点 ID
+
+        重复的锚点（如同一 ArXiv ID 出现多次）依次追加 -2、-3 后缀
+
+        Args:
+            papers: 论文列表
+
+        Returns:
+            与论文顺序一致的锚点 ID 列表
+        """
+        anchors = []
+        seen: Dict[str, int] = {}
+        for i, paper in enumerate(papers, 1):
+            anchor = self._make_anchor_id(paper, i)
+            if anchor in seen:
+                seen[anchor] += 1
+                anchor = f"{anchor}-{seen[anchor]}"
+            else:
+                seen[anchor] = 1
+            anchors.append(anchor)
+        return anchors
+
     def save_to_file(self, content: str, file_path: str) -> bool:
         """
         保存 Markdown 内容到文件
@@ -267,8 +373,9 @@ class MarkdownGenerator:
             是否保存成功
         """
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            # 一次性编码后以二进制写入，跳过文本模式的分块编码层
+            with open(file_path, "wb") as f:
+                f.write(content.encode("utf-8"))
 
             self.logger.info(f"Markdown 文档已保存到: {file_path}")
             return True
@@ -287,16 +394,15 @@ class MarkdownGenerator:
         Returns:
             HTML 内容
         """
-        try:
-            import markdown
-
-            html = markdown.markdown(
-                markdown_content, extensions=["extra", "codehilite", "toc"]
-            )
-            return self._wrap_html(html)
-        except ImportError:
+        if markdown is None:
             self.logger.warning("markdown 库未安装，无法转换为 HTML")
             return ""
+
+        try:
+            if self._md is None:
+                self._md = markdown.Markdown(extensions=["extra", "codehilite", "toc"])
+            html = self._md.reset().convert(markdown_content)
+            return self._wrap_html(html)
         except Exception as e:
             self.logger.error(f"Markdown 转 HTML 失败: {str(e)}")
             return ""
@@ -311,64 +417,4 @@ class MarkdownGenerator:
         Returns:
             完整的 HTML 文档
         """
-        return f"""<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ArXiv 论文日报</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
-            line-height: 1.6;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-            color: #333;
-        }}
-        h1, h2, h3 {{
-            color: #2c3e50;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 10px;
-        }}
-        h1 {{ font-size: 2.5em; }}
-        h2 {{ font-size: 2em; margin-top: 40px; }}
-        h3 {{ font-size: 1.5em; margin-top: 30px; }}
-        blockquote {{
-            border-left: 4px solid #3498db;
-            padding-left: 20px;
-            margin: 20px 0;
-            color: #555;
-            background-color: #f9f9f9;
-            padding: 15px;
-        }}
-        code {{
-            background-color: #f4f4f4;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-        }}
-        a {{
-            color: #3498db;
-            text-decoration: none;
-        }}
-        a:hover {{
-            text-decoration: underline;
-        }}
-        hr {{
-            border: none;
-            border-top: 2px solid #eee;
-            margin: 40px 0;
-        }}
-        ul {{
-            padding-left: 20px;
-        }}
-        li {{
-            margin: 10px 0;
-        }}
-    </style>
-</head>
-<body>
-{body}
-</body>
-</html>"""
+        return HTML_TEMPLATE.replace("{body}", body)
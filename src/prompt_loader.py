@@ -6,13 +6,24 @@ Prompt加载模块
 import os
 import yaml
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+# 默认prompts配置文件路径
+DEFAULT_PROMPTS_FILE = "./prompts/prompts.yaml"
+
+
+def _get_mtime(path: str) -> Optional[float]:
+    """获取文件修改时间，文件不存在时返回 None"""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
 
 
 class PromptLoader:
     """Prompt加载器"""
 
-    def __init__(self, prompts_file: str = "./prompts/prompts.yaml"):
+    def __init__(self, prompts_file: str = DEFAULT_PROMPTS_FILE):
         """
         初始化Prompt加载器
 
@@ -21,6 +32,8 @@ class PromptLoader:
         """
         self.prompts_file = prompts_file
         self.logger = logging.getLogger(__name__)
+        # 记录加载时的文件修改时间，用于判断缓存的实例是否过期
+        self.mtime = _get_mtime(prompts_file)
         self.prompts = self._load_prompts()
 
     def _load_prompts(self) -> Dict[str, Any]:
@@ -133,18 +146,44 @@ class PromptLoader:
     "洞察2：简短描述（不超过30字）",
     "洞察3：简短描述（不超过30字）"
   ]
+}}""",
+            },
+            "combined": {
+                "system": "你是一位专业的学术论文分析专家，擅长提炼论文核心要点并进行专业翻译。",
+                "user_template": """请阅读以下学术论文信息，并同时完成三项任务：
+
+1. summary：对论文进行总结分析，包括核心观点、研究方法、关键结果、应用价值四个方面，使用清晰的结构化格式
+2. translation：将英文摘要翻译成{lang_name}，要求翻译准确、专业、流畅
+3. insights：提取 3-5 个关键洞察，每个洞察不超过30字
+
+论文信息：
+标题：{title}
+作者：{authors}
+摘要：{summary}
+
+请严格按照以下JSON格式输出（不要添加任何其他内容）：
+{{
+  "summary": "中文结构化总结",
+  "translation": "摘要译文",
+  "insights": [
+    "洞察1：简短描述",
+    "洞察2：简短描述",
+    "洞察3：简短描述"
+  ]
 }}""",
             },
         }
 
 
-# 全局prompt加载器实例
-_prompt_loader = None
+# 按文件路径缓存的prompt加载器实例
+_prompt_loaders: Dict[str, PromptLoader] = {}
 
 
-def get_prompt_loader(prompts_file: str = "./prompts/prompts.yaml") -> PromptLoader:
+def get_prompt_loader(prompts_file: str = DEFAULT_PROMPTS_FILE) -> PromptLoader:
     """
-    获取全局prompt加载器实例
+    获取prompt加载器实例
+
+    同一文件只解析一次；文件被修改后（修改时间变化）自动重新加载
 
     Args:
         prompts_file: prompts配置文件路径
@@ -152,7 +191,8 @@ def get_prompt_loader(prompts_file: str = "./prompts/prompts.yaml") -> PromptLoa
     Returns:
         PromptLoader实例
     """
-    global _prompt_loader
-    if _prompt_loader is None:
-        _prompt_loader = PromptLoader(prompts_file)
-    return _prompt_loader
+    loader = _prompt_loaders.get(prompts_file)
+    if loader is None or loader.mtime != _get_mtime(prompts_file):
+        loader = PromptLoader(prompts_file)
+        _prompt_loaders[prompts_file] = loader
+    return loader
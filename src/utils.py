@@ -3,14 +3,19 @@
 提供日志配置、通知发送等辅助功能
 """
 
+import atexit
+import base64
+import functools
+import inspect
 import os
+import json
 import logging
+import queue
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
-from email import encoders
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Dict, Any, List, Optional
 import requests
 from requests.adapters import HTTPAdapter
@@ -18,11 +23,40 @@ from urllib3.util.retry import Retry
 import colorlog
 import time
 
+# urllib3 1.26 起将 method_whitelist 更名为 allowed_methods，导入时探测一次即可
+RETRY_METHODS_KWARG = (
+    "allowed_methods"
+    if "allowed_methods" in inspect.signature(Retry.__init__).parameters
+    else "method_whitelist"
+)
+
+# 附件分块编码大小（57 字节正好编码为一行 76 个 Base64 字符）
+ATTACHMENT_CHUNK_SIZE = 57 * 1024
+
+try:
+    import orjson
+except ImportError:  # 可选依赖，未安装时回退到标准库 json
+    orjson = None
+
+
+# 后台日志监听器（负责实际的文件/控制台写入）
+_log_listener: Optional[QueueListener] = None
+
+
+def _stop_log_listener() -> None:
+    """停止后台日志监听器，并写出队列中剩余的日志"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
 
 def setup_logging(config: Dict[str, Any]) -> None:
     """
     配置日志系统
 
+    日志记录只入队，由后台 QueueListener 线程写入文件和控制台
+
     Args:
         config: 日志配置字典
     """
@@ -41,8 +75,10 @@ def setup_logging(config: Dict[str, Any]) -> None:
     logger = logging.getLogger()
     logger.setLevel(getattr(logging, log_level))
 
-    # 清除现有的处理器
+    # 清除现有的处理器（并停止上一次配置的监听器）
     logger.handlers.clear()
+    _stop_log_listener()
+    handlers = []
 
     # 文件处理器（带日志轮转）
     file_handler = RotatingFileHandler(
@@ -53,7 +89,7 @@ def setup_logging(config: Dict[str, Any]) -> None:
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    handlers.append(file_handler)
 
     # 控制台处理器（带颜色）
     if console_output:
@@ -70,7 +106,39 @@ def setup_logging(config: Dict[str, Any]) -> None:
             },
         )
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    global _log_listener
+    log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    logger.addHandler(QueueHandler(log_queue))
+
+
+atexit.register(_stop_log_listener)
+
+
+def dumps_json_bytes(data: Any, indent: bool = False) -> bytes:
+    """
+    将数据序列化为 UTF-8 编码的 JSON 字节串
+
+    优先使用 orjson（C 实现），未安装时回退到标准库 json，
+    两者均保留非 ASCII 字符
+
+    Args:
+        data: 待序列化的数据
+        indent: 是否使用 2 空格缩进
+
+    Returns:
+        JSON 字节串
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(data, option=option)
+
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode(
+        "utf-8"
+    )
 
 
 def create_retry_session(
@@ -78,6 +146,7 @@ def create_retry_session(
     backoff_factor: float = 0.5,
     status_forcelist: Optional[List[int]] = None,
     allowed_methods: Optional[List[str]] = None,
+    pool_maxsize: int = 10,
 ) -> requests.Session:
     """
     创建带重试机制的 requests Session
@@ -87,6 +156,7 @@ def create_retry_session(
         backoff_factor: 退避系数（用于指数退避）
         status_forcelist: 需要重试的状态码列表
         allowed_methods: 允许重试的 HTTP 方法列表
+        pool_maxsize: 每个主机保持的最大连接数（应不小于并发线程数）
 
     Returns:
         配置好重试策略的 Session
@@ -113,17 +183,26 @@ def create_retry_session(
         raise_on_status=False,
     )
 
-    try:
-        retry = Retry(**retry_kwargs, allowed_methods=frozenset(allowed_methods))
-    except TypeError:
-        retry = Retry(**retry_kwargs, method_whitelist=frozenset(allowed_methods))
+    retry_kwargs[RETRY_METHODS_KWARG] = frozenset(allowed_methods)
+    retry = Retry(**retry_kwargs)
 
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=pool_maxsize)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
 
 
+@functools.lru_cache(maxsize=1)
+def _get_default_session() -> requests.Session:
+    """
+    获取模块共享的带重试 Session（Webhook 等零散请求复用连接，避免每次重新握手）
+
+    只对幂等的读请求在读超时/错误状态码时重试；POST/PUT 仅在连接建立失败
+    （请求尚未发出）时重试，避免同一条通知或报告被重复投递
+    """
+    return create_retry_session(allowed_methods=["HEAD", "GET", "OPTIONS"])
+
+
 def send_notification(
     config: Dict[str, Any], message: str, subject: str = None
 ) -> bool:
@@ -170,7 +249,6 @@ def _send_email(config: Dict[str, Any], message: str, subject: str = None) -> bo
         是否发送成功
     """
     smtp_server = config.get("smtp_server")
-    smtp_port = config.get("smtp_port", 587)
     sender = config.get("sender")
     password = config.get("password")
     recipients = config.get("recipients", [])
@@ -189,13 +267,36 @@ def _send_email(config: Dict[str, Any], message: str, subject: str = None) -> bo
         # 添加邮件正文
         msg.attach(MIMEText(message, "plain", "utf-8"))
 
+    except Exception as e:
+        logging.error(f"发送邮件失败: {str(e)}")
+        return False
+
+    if not _deliver_email(config, msg):
+        return False
+
+    logging.info("邮件通知发送成功")
+    return True
+
+
+def _deliver_email(config: Dict[str, Any], msg: MIMEMultipart) -> bool:
+    """
+    连接 SMTP 服务器并发送已构建好的邮件
+
+    Args:
+        config: 邮件配置
+        msg: 邮件对象
+
+    Returns:
+        是否发送成功
+    """
+    try:
         # 连接 SMTP 服务器并发送（设置30秒超时）
-        with smtplib.SMTP(smtp_server, smtp_port, timeout=30) as server:
+        with smtplib.SMTP(
+            config.get("smtp_server"), config.get("smtp_port", 587), timeout=30
+        ) as server:
             server.starttls()
-            server.login(sender, password)
+            server.login(config.get("sender"), config.get("password"))
             server.send_message(msg)
-
-        logging.info("邮件通知发送成功")
         return True
 
     except smtplib.SMTPException as e:
@@ -235,9 +336,9 @@ def _send_webhook(config: Dict[str, Any], message: str, subject: str = None) ->
         payload = {"subject": subject or "ArXiv 论文抓取通知", "message": message}
 
         if method == "POST":
-            response = requests.post(url, json=payload, timeout=10)
+            response = _get_default_session().post(url, json=payload, timeout=10)
         elif method == "GET":
-            response = requests.get(url, params=payload, timeout=10)
+            response = _get_default_session().get(url, params=payload, timeout=10)
         else:
             logging.error(f"不支持的 HTTP 方法: {method}")
             return False
@@ -347,27 +448,55 @@ def ensure_directories(config: Dict[str, Any]) -> None:
         os.makedirs(log_dir, exist_ok=True)
 
 
+def _set_base64_payload(part: MIMEBase, file_path: str) -> None:
+    """
+    分块读取文件并以 Base64 编码设置为附件内容
+
+    每块为 57 字节的整数倍，拼接结果与整体编码完全一致（每行 76 字符），
+    避免同时在内存中保留原始文件和编码结果
+
+    Args:
+        part: 附件对象
+        file_path: 文件路径
+    """
+    chunks = []
+    with open(file_path, "rb") as f:
+        while True:
+            chunk = f.read(ATTACHMENT_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(base64.encodebytes(chunk))
+
+    part.set_payload(b"".join(chunks).decode("ascii"))
+    part["Content-Transfer-Encoding"] = "base64"
+
+
 def send_email_with_attachments(
     config: Dict[str, Any],
     message: str,
     subject: str,
     attachments: Optional[List[Dict[str, str]]] = None,
+    max_retries: int = 1,
+    retry_delay: int = 5,
 ) -> bool:
     """
     发送带附件的邮件
 
+    邮件（含附件）只构建一次，发送失败时仅重试 SMTP 投递
+
     Args:
         config: 邮件配置
         message: 邮件正文
         subject: 邮件主题
         attachments: 附件列表，每个附件是一个字典:
                     {'file_path': '文件路径', 'filename': '附件名称（可选）'}
+        max_retries: 最大发送次数
+        retry_delay: 重试延迟（秒）
 
     Returns:
         是否发送成功
     """
     smtp_server = config.get("smtp_server")
-    smtp_port = config.get("smtp_port", 587)
     sender = config.get("sender")
     password = config.get("password")
     recipients = config.get("recipients", [])
@@ -394,13 +523,9 @@ def send_email_with_attachments(
                     logging.warning(f"附件文件不存在: {file_path}")
                     continue
 
-                # 读取文件
-                with open(file_path, "rb") as f:
-                    part = MIMEBase("application", "octet-stream")
-                    part.set_payload(f.read())
-
-                # 编码附件
-                encoders.encode_base64(part)
+                # 分块读取并编码附件
+                part = MIMEBase("application", "octet-stream")
+                _set_base64_payload(part, file_path)
 
                 # 设置附件文件名
                 filename = attachment_info.get("filename") or os.path.basename(
@@ -414,28 +539,26 @@ def send_email_with_attachments(
 
                 logging.info(f"已添加附件: {filename}")
 
-        # 连接 SMTP 服务器并发送（设置30秒超时）
-        with smtplib.SMTP(smtp_server, smtp_port, timeout=30) as server:
-            server.starttls()
-            server.login(sender, password)
-            server.send_message(msg)
-
-        logging.info("带附件的邮件发送成功")
-        return True
-
-    except smtplib.SMTPException as e:
-        logging.error(f"SMTP 错误: {str(e)}")
-        return False
-    except TimeoutError as e:
-        logging.error(f"连接超时: {str(e)}")
-        logging.error(
-            "请检查: 1) SMTP服务器地址和端口是否正确 2) 网络连接是否正常 3) 防火墙设置"
-        )
-        return False
     except Exception as e:
-        logging.error(f"发送带附件邮件失败: {str(e)}")
+        logging.error(f"构建带附件邮件失败: {str(e)}")
         return False
 
+    for attempt in range(1, max_retries + 1):
+        if max_retries > 1:
+            logging.info(f"尝试发送邮件 (第 {attempt}/{max_retries} 次)...")
+
+        if _deliver_email(config, msg):
+            logging.info("带附件的邮件发送成功")
+            return True
+
+        if attempt < max_retries:
+            logging.warning(f"邮件发送失败，{retry_delay} 秒后重试...")
+            time.sleep(retry_delay)
+        elif max_retries > 1:
+            logging.error(f"邮件发送失败，已达到最大重试次数 ({max_retries})")
+
+    return False
+
 
 def send_email_with_retry(
     config: Dict[str, Any],
@@ -459,21 +582,14 @@ def send_email_with_retry(
     Returns:
         是否发送成功
     """
-    for attempt in range(1, max_retries + 1):
-        logging.info(f"尝试发送邮件 (第 {attempt}/{max_retries} 次)...")
-
-        success = send_email_with_attachments(config, message, subject, attachments)
-
-        if success:
-            return True
-
-        if attempt < max_retries:
-            logging.warning(f"邮件发送失败，{retry_delay} 秒后重试...")
-            time.sleep(retry_delay)
-        else:
-            logging.error(f"邮件发送失败，已达到最大重试次数 ({max_retries})")
-
-    return False
+    return send_email_with_attachments(
+        config,
+        message,
+        subject,
+        attachments,
+        max_retries=max(1, max_retries),
+        retry_delay=retry_delay,
+    )
 
 
 def send_report_via_webhook(
@@ -515,10 +631,17 @@ def send_report_via_webhook(
             "User-Agent": "ArXiv-Paper-Agent/1.0",
         }
 
+        # 报告内容可能较大，优先用 orjson 序列化（非 ASCII 字符直接以 UTF-8 发送）
+        body = dumps_json_bytes(payload)
+
         if method == "POST":
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = _get_default_session().post(
+                url, data=body, headers=headers, timeout=30
+            )
         elif method == "PUT":
-            response = requests.put(url, json=payload, headers=headers, timeout=30)
+            response = _get_default_session().put(
+                url, data=body, headers=headers, timeout=30
+            )
         else:
             logging.error(f"不支持的 HTTP 方法: {method}")
             return False
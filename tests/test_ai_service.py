@@ -0,0 +1,103 @@
+"""AI 服务模块测试"""
+
+import json
+
+import pytest
+
+from src.ai_service import BaseAIService
+
+PAPER = {"title": "Title", "authors": ["Alice"], "summary": "Abstract"}
+
+
+class StubAIService(BaseAIService):
+    """返回固定响应的 AI 服务，逐项调用时返回可识别的回退结果"""
+
+    def __init__(self, config, response_text):
+        super().__init__(config)
+        self.response_text = response_text
+
+    def _complete(self, system_prompt, user_prompt):
+        return self.response_text
+
+    def summarize_paper(self, paper):
+        return {"summary": "fallback summary", "status": "success"}
+
+    def translate_text(self, text, target_lang="zh"):
+        return "fallback translation"
+
+    def extract_insights(self, paper):
+        return {"insights": ["fallback insight"], "status": "success"}
+
+    def filter_paper(self, paper, filter_keywords):
+        return {"relevant": True, "confidence": 1.0, "reason": "", "status": "success"}
+
+
+@pytest.fixture
+def make_service(tmp_path):
+    """创建带 combined 模板的 StubAIService"""
+    prompts_file = tmp_path / "prompts.yaml"
+    prompts_file.write_text(
+        "combined:\n  system: sys\n  user_template: '{title} {summary}'\n",
+        encoding="utf-8",
+    )
+
+    def _make(response_text):
+        return StubAIService(
+            {"combined_processing": True, "prompts_file": str(prompts_file)},
+            response_text,
+        )
+
+    return _make
+
+
+class TestProcessPaperCombined:
+    """合并处理测试"""
+
+    def test_code_fenced_json(self, make_service):
+        payload = {
+            "summary": " combined summary ",
+            "translation": "combined translation",
+            "insights": ["a", "b"],
+        }
+        service = make_service(f"```json\n{json.dumps(payload)}\n```")
+
+        result = service.process_paper(PAPER)
+
+        assert result == {
+            "ai_summary": {"summary": "combined summary", "status": "success"},
+            "translation": "combined translation",
+            "insights": {"insights": ["a", "b"], "status": "success"},
+        }
+
+    def test_missing_field_falls_back(self, make_service):
+        service = make_service(json.dumps({"summary": "combined summary"}))
+
+        result = service.process_paper(PAPER)
+
+        assert result["ai_summary"]["summary"] == "combined summary"
+        assert result["translation"] == "fallback translation"
+        assert result["insights"]["insights"] == ["fallback insight"]
+
+    def test_non_string_field_falls_back(self, make_service):
+        payload = {
+            "summary": {"text": "nested"},
+            "translation": ["not", "a", "string"],
+            "insights": "not a list",
+        }
+        service = make_service(json.dumps(payload))
+
+        result = service.process_paper(PAPER)
+
+        assert result["ai_summary"]["summary"] == "fallback summary"
+        assert result["translation"] == "fallback translation"
+        assert result["insights"]["insights"] == ["fallback insight"]
+
+    def test_unparseable_response_uses_per_item_calls(self, make_service):
+        service = make_service("not json at all")
+
+        assert service._process_paper_combined(PAPER, True, True, True) is None
+        assert service.process_paper(PAPER) == {
+            "ai_summary": {"summary": "fallback summary", "status": "success"},
+            "translation": "fallback translation",
+            "insights": {"insights": ["fallback insight"], "status": "success"},
+        }
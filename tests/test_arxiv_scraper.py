@@ -0,0 +1,135 @@
+"""论文抓取模块测试"""
+
+import csv
+import os
+
+from src.arxiv_scraper import SEARCH_CACHE_FILE_PATTERN, ArxivScraper
+
+
+class TestSaveAsCsv:
+    """CSV 保存测试"""
+
+    def test_header_union_and_list_fields(self, tmp_path):
+        scraper = ArxivScraper(
+            {"storage": {"data_dir": str(tmp_path), "cache_enabled": False}}
+        )
+        papers = [
+            {
+                "arxiv_id": "2401.00001",
+                "title": "First",
+                "authors": ["Alice", "Bob"],
+                "categories": ["cs.AI", "cs.LG"],
+            },
+            {
+                "arxiv_id": "2401.00002",
+                "title": "Second",
+                "authors": [],
+                "categories": None,
+                "doi": "10.1000/xyz",
+                "comment": None,
+            },
+        ]
+
+        filepath = scraper._save_as_csv(papers, "test")
+
+        with open(filepath, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+
+        assert rows[0] == [
+            "arxiv_id",
+            "title",
+            "authors",
+            "categories",
+            "doi",
+            "comment",
+        ]
+        assert rows[1] == ["2401.00001", "First", "Alice; Bob", "cs.AI; cs.LG", "", ""]
+        assert rows[2] == ["2401.00002", "Second", "", "", "10.1000/xyz", ""]
+
+
+class TestMarkdownReport:
+    """Markdown 报告测试"""
+
+    def test_report_kept_when_notification_disabled(self, tmp_path):
+        report_dir = tmp_path / "reports"
+        scraper = ArxivScraper(
+            {
+                "storage": {
+                    "data_dir": str(tmp_path),
+                    "cache_enabled": False,
+                    "auto_cleanup": True,
+                },
+                "ai": {
+                    "send_markdown_report": True,
+                    "markdown_dir": str(report_dir),
+                },
+                "notification": {"enabled": False},
+            }
+        )
+        papers = [
+            {
+                "arxiv_id": "2401.00001",
+                "title": "First",
+                "authors": ["Alice"],
+                "categories": ["cs.AI"],
+                "summary": "Abstract",
+            }
+        ]
+
+        filepath = scraper.generate_and_send_markdown_report(papers)
+
+        assert filepath is not None
+        assert os.path.dirname(filepath) == str(report_dir)
+        assert os.path.exists(filepath)
+
+
+class TestSearchCache:
+    """搜索结果缓存测试"""
+
+    def make_scraper(self, tmp_path, refresh_search_cache=False):
+        return ArxivScraper(
+            {
+                "storage": {
+                    "data_dir": str(tmp_path),
+                    "cache_enabled": False,
+                    "search_cache_enabled": True,
+                    "search_cache_dir": str(tmp_path / "cache"),
+                }
+            },
+            refresh_search_cache=refresh_search_cache,
+        )
+
+    def test_save_removes_only_stale_cache_files(self, tmp_path):
+        scraper = self.make_scraper(tmp_path)
+        cache_path = scraper._get_search_cache_path("cat:cs.AI", 10)
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+
+        stale = f"search_20000101_{'a' * 40}.json"
+        kept = [
+            "notes.json",
+            f"search_20000101_{'a' * 40}.json.bak",
+            f"search_20000101_{'z' * 40}.json",
+            "search_2000_short.json",
+        ]
+        today = SEARCH_CACHE_FILE_PATTERN.fullmatch(os.path.basename(cache_path))[1]
+        same_day = f"search_{today}_{'b' * 40}.json"
+        for name in [stale, same_day, *kept]:
+            (cache_dir / name).write_text("[]", encoding="utf-8")
+
+        scraper._save_search_cache(cache_path, [{"arxiv_id": "2401.00001"}])
+
+        assert sorted(os.listdir(cache_dir)) == sorted(
+            [os.path.basename(cache_path), same_day, *kept]
+        )
+        assert scraper._load_search_cache(cache_path) == [{"arxiv_id": "2401.00001"}]
+
+    def test_refresh_ignores_same_day_cache(self, tmp_path):
+        scraper = self.make_scraper(tmp_path)
+        cache_path = scraper._get_search_cache_path("cat:cs.AI", 10)
+        scraper._save_search_cache(cache_path, [{"arxiv_id": "2401.00001"}])
+
+        refreshing = self.make_scraper(tmp_path, refresh_search_cache=True)
+
+        assert refreshing._get_search_cache_path("cat:cs.AI", 10) == cache_path
+        assert refreshing._load_search_cache(cache_path) is None
@@ -1,39 +1,45 @@
 """配置模块测试"""
 
-import os
+import io
 import pytest
-import tempfile
 import yaml
 
+from src.config import ConfigManager, _resolve_env_vars
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
+
+@pytest.fixture
+def make_config():
+    """由字典构建 ConfigManager（YAML 在内存中生成，无需临时文件）"""
+
+    def _make(data):
+        return ConfigManager(io.StringIO(yaml.dump(data, Dumper=SafeDumper)))
+
+    return _make
+
 
 class TestEnvVarResolution:
     """环境变量解析测试"""
 
-    def test_resolve_env_var_with_braces(self):
-        from src.config import _resolve_env_vars
-
-        os.environ["TEST_API_KEY"] = "test-key-123"
+    def test_resolve_env_var_with_braces(self, monkeypatch):
+        monkeypatch.setenv("TEST_API_KEY", "test-key-123")
         result = _resolve_env_vars("${TEST_API_KEY}")
         assert result == "test-key-123"
-        del os.environ["TEST_API_KEY"]
 
-    def test_resolve_env_var_without_braces(self):
-        from src.config import _resolve_env_vars
-
-        os.environ["TEST_VAR"] = "value"
+    def test_resolve_env_var_without_braces(self, monkeypatch):
+        monkeypatch.setenv("TEST_VAR", "value")
         result = _resolve_env_vars("$TEST_VAR")
         assert result == "value"
-        del os.environ["TEST_VAR"]
 
     def test_unset_env_var_keeps_original(self):
-        from src.config import _resolve_env_vars
-
         result = _resolve_env_vars("${UNDEFINED_VAR}")
         assert result == "${UNDEFINED_VAR}"
 
     def test_non_string_passthrough(self):
-        from src.config import _resolve_env_vars
-
         assert _resolve_env_vars(123) == 123
         assert _resolve_env_vars(True) is True
 
@@ -42,63 +48,86 @@ class TestConfigManager:
     """ConfigManager 测试"""
 
     def test_load_default_config_when_file_missing(self):
-        from src.config import ConfigManager
-
         manager = ConfigManager("nonexistent.yaml")
         assert "arxiv" in manager.config
         assert "logging" in manager.config
 
-    def test_get_nested_config(self):
-        from src.config import ConfigManager
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump({"arxiv": {"max_results": 100}}, f)
-            f.flush()
-            manager = ConfigManager(f.name)
-            assert manager.get("arxiv.max_results") == 100
-            os.unlink(f.name)
+    def test_get_nested_config(self, make_config):
+        manager = make_config({"arxiv": {"max_results": 100}})
+        assert manager.get("arxiv.max_results") == 100
 
-    def test_env_var_override(self):
-        from src.config import ConfigManager
+    def test_env_var_override(self, make_config, monkeypatch):
+        monkeypatch.setenv("ARXIV_OPENAI_API_KEY", "env-api-key")
 
-        os.environ["ARXIV_OPENAI_API_KEY"] = "env-api-key"
+        manager = make_config({"ai": {"openai": {"api_key": "file-key"}}})
+        assert manager.get("ai.openai.api_key") == "env-api-key"
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump({"ai": {"openai": {"api_key": "file-key"}}}, f)
-            f.flush()
-            manager = ConfigManager(f.name)
-            assert manager.get("ai.openai.api_key") == "env-api-key"
-            os.unlink(f.name)
+    def test_env_var_placeholder_in_nested_section(self, make_config, monkeypatch):
+        monkeypatch.setenv("TEST_SMTP_SERVER", "smtp.example.com")
 
-        del os.environ["ARXIV_OPENAI_API_KEY"]
+        manager = make_config(
+            {"notification": {"email": {"smtp_server": "${TEST_SMTP_SERVER}"}}}
+        )
+        assert manager.get("notification.email.smtp_server") == "smtp.example.com"
 
     def test_set_and_get(self):
-        from src.config import ConfigManager
-
         manager = ConfigManager("nonexistent.yaml")
         manager.set("custom.key", "value")
         assert manager.get("custom.key") == "value"
 
+    def test_reload_picks_up_modified_file(self, tmp_path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            yaml.dump({"arxiv": {"max_results": 10}}, Dumper=SafeDumper)
+        )
+        manager = ConfigManager(str(config_file))
+        manager.set("arxiv.max_results", 20)
+        assert ConfigManager(str(config_file)).get("arxiv.max_results") == 10
+
+        config_file.write_text(
+            yaml.dump({"arxiv": {"max_results": 30}}, Dumper=SafeDumper)
+        )
+        manager.reload()
+        assert manager.get("arxiv.max_results") == 30
+
+    def test_stream_config_reload_and_save(self, make_config):
+        manager = make_config({"arxiv": {"max_results": 7}})
+        manager.set("arxiv.max_results", 8)
+        manager.reload()
+        assert manager.get("arxiv.max_results") == 7
+
+        with pytest.raises(ValueError):
+            manager.save()
+
+    def test_set_does_not_leak_into_default_config(self):
+        manager = ConfigManager("nonexistent.yaml")
+        manager.set("logging.level", "DEBUG")
+        assert ConfigManager.DEFAULT_CONFIG["logging"]["level"] == "INFO"
+        assert ConfigManager("nonexistent.yaml").get("logging.level") == "INFO"
+
+    def test_default_config_is_read_only(self):
+        with pytest.raises(TypeError):
+            ConfigManager.DEFAULT_CONFIG["logging"]["level"] = "DEBUG"
+        with pytest.raises(TypeError):
+            ConfigManager.DEFAULT_CONFIG["arxiv"]["keywords"][0] = "physics"
+
+        manager = ConfigManager("nonexistent.yaml")
+        manager.config["arxiv"]["keywords"].append("physics")
+        assert ConfigManager.DEFAULT_CONFIG["arxiv"]["keywords"] == (
+            "machine learning",
+        )
+
 
 class TestConfigValidation:
     """配置验证测试"""
 
-    def test_invalid_max_results_uses_default(self):
-        from src.config import ConfigManager
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump({"arxiv": {"max_results": -1}}, f)
-            f.flush()
-            manager = ConfigManager(f.name)
-            assert manager.get("arxiv.max_results") == 50
-            os.unlink(f.name)
-
-    def test_invalid_sort_by_uses_default(self):
-        from src.config import ConfigManager
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump({"arxiv": {"sort_by": "invalid"}}, f)
-            f.flush()
-            manager = ConfigManager(f.name)
-            assert manager.get("arxiv.sort_by") == "submittedDate"
-            os.unlink(f.name)
+    @pytest.mark.parametrize(
+        "data, key, expected",
+        [
+            ({"arxiv": {"max_results": -1}}, "arxiv.max_results", 50),
+            ({"arxiv": {"sort_by": "invalid"}}, "arxiv.sort_by", "submittedDate"),
+        ],
+    )
+    def test_invalid_value_uses_default(self, make_config, data, key, expected):
+        manager = make_config(data)
+        assert manager.get(key) == expected